@@ -1,36 +1,53 @@
 #!/usr/bin/env python3
-from future import annotations
+from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import logging
+import os
+import queue
 import re
 import threading
+from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from collections import defaultdict
 
 import numpy as np
-import sounddevice as sd
+
+try:
+    import orjson  # noticeably faster than stdlib json on expected.json payloads
+except Exception:
+    orjson = None
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
-from PIL import ImageTk
-from piano_transcription_inference import sample_rate
 
 import subprocess
 import sys
 
-from transcribe.app import TranscriptionApp
-from transcribe.filters import FilterConfig
-from transcribe.frame import FrameConfig
+# NOTE: transcribe.*, sounddevice and PIL are imported lazily (inside the
+# methods that need them). Importing them here would pull in torch/librosa/
+# music21/the PortAudio DLL before the first Tk paint and delay window
+# startup by seconds.
 
-# ✅ Sheet rendering
-from transcribe.sheet_render import render_grand_staff_from_notes_txt
+# piano_transcription_inference.sample_rate — fixed by the model checkpoint;
+# hardcoded so importing it (and torch with it) isn't needed at startup.
+sample_rate = 16000
 
 
 # -------------------------
 # Presets
 # -------------------------
-def filter_cfg_from_preset(preset: str) -> FilterConfig:
+@functools.lru_cache(maxsize=8)
+def filter_cfg_from_preset(preset: str):
+    # Only three presets exist and FilterConfig is frozen, so the cached
+    # instance is safe to share across runs.
+    from transcribe.filters import FilterConfig
+
     preset = preset.lower().strip()
 
     if preset == "raw":
@@ -54,20 +71,40 @@ def filter_cfg_from_preset(preset: str) -> FilterConfig:
     raise ValueError("preset must be raw|clean|aggressive")
 
 
+# Debug logging instead of print(): no stdout lock/flush on GUI paths,
+# silent unless the app configures logging. User-visible status goes
+# through _set_status.
+logger = logging.getLogger(__name__)
+
+# Hop entry must be a plain positive number, e.g. "0.05".
+# Compiled once so keystroke validation doesn't rebuild the pattern.
+_HOP_RE = re.compile(r"\d*\.?\d+")
+
+
 # -------------------------
 # OS helpers
 # -------------------------
 def open_folder(path: Path) -> None:
-    path = path.expanduser().resolve()
-    if not path.exists():
+    # expanduser() is enough for open/explorer/xdg-open; resolve() would
+    # lstat every path component. lexists() is one syscall and all we need
+    # to know is that the folder is openable.
+    path = path.expanduser()
+    if not os.path.lexists(path):
         return
+    # Fire-and-forget: don't block the UI thread waiting for the file
+    # manager to launch. os.startfile skips the subprocess module entirely.
     try:
-        if sys.platform.startswith("darwin"):
-            subprocess.run(["open", str(path)], check=False)
-        elif sys.platform.startswith("win"):
-            subprocess.run(["explorer", str(path)], check=False)
+        if sys.platform == "win32":
+            os.startfile(str(path))  # noqa: attribute only exists on Windows
         else:
-            subprocess.run(["xdg-open", str(path)], check=False)
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen(
+                [opener, str(path)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+            )
     except Exception:
         pass
 
@@ -85,7 +122,7 @@ def make_card(parent: tk.Widget, *, title: str) -> ttk.Frame:
 # - Order-based matching with lookahead
 # - Extra detected notes are ignored
 # -------------------------
-PC_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+PC_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
 
 
 def midi_to_pc(m: int) -> int:
@@ -100,8 +137,6 @@ def _extract_expected_blocks(obj) -> dict:
     """
     Accepts multiple possible expected.json formats:
       A) {"events":{"RH":{meas:[{"offset":..., "midis":[...]}]}, "LH":{...}}}
-      😎 {"RH":{meas:[(offset,[midis...]), ...]}, "LH":{...}}  (older)
-=======
       B) {"RH":{meas:[(offset,[midis...]), ...]}, "LH":{...}}  (older)
       C) {"events":{"RH":{meas:[(offset,[midis...]), ...]}, ...}} (mixed)
     Returns dict with keys RH/LH (if present), each mapping measure->list of events.
@@ -119,18 +154,60 @@ def _extract_expected_blocks(obj) -> dict:
     return out
 
 
-def load_expected_sequence_by_measure(expected_path: Path) -> dict[int, list[int]]:
+def _event_pairs(events: list) -> list[tuple[float, list | None]]:
     """
-    Returns: {measure_no: [pc, pc, pc, ...]} in "sheet order"
+    Turn one measure's event list into (offset, midis) pairs.
+
+    The event shape (dict vs tuple format) is detected once from the first
+    entry so the common homogeneous case skips per-event isinstance tests;
+    mixed or malformed lists fall through to the tolerant walk.
+    """
+    first = events[0]
+    try:
+        if isinstance(first, dict):
+            return [(float(ev.get("offset", 0.0)), ev.get("midis")) for ev in events]
+        if isinstance(first, (list, tuple)) and len(first) >= 2:
+            return [(float(ev[0]), ev[1]) for ev in events]
+    except Exception:
+        pass
+
+    pairs: list[tuple[float, list | None]] = []
+    for ev in events:
+        off = 0.0
+        midis = None
+        if isinstance(ev, dict):
+            try:
+                off = float(ev.get("offset", 0.0))
+            except Exception:
+                off = 0.0
+            midis = ev.get("midis", None)
+        elif isinstance(ev, (list, tuple)) and len(ev) >= 2:
+            try:
+                off = float(ev[0])
+            except Exception:
+                off = 0.0
+            midis = ev[1]
+        pairs.append((off, midis))
+    return pairs
+
+
+def load_expected_sequence_by_measure(expected_path: Path) -> dict[int, bytes]:
+    """
+    Returns: {measure_no: pc sequence packed as bytes} in "sheet order"
     - merges RH+LH
     - uses 'offset' only to sort events inside measure (NOT for timing validation)
     - flattens chords: if one event has multiple midis, we add them in sorted pc order
     """
-    data = json.loads(expected_path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        data = orjson.loads(expected_path.read_bytes())
+    else:
+        data = json.loads(expected_path.read_text(encoding="utf-8"))
     blocks = _extract_expected_blocks(data)
 
-    # temp: per measure store list of (offset, [pcs...])
-    tmp: dict[int, list[tuple[float, list[int]]]] = defaultdict(list)
+    # Parallel per-measure staging (offsets + pc groups) instead of a
+    # tuple per event; RH/LH can both contribute to the same measure.
+    offs_by_meas: dict[int, list[float]] = defaultdict(list)
+    pcs_by_meas: dict[int, list[list[int]]] = defaultdict(list)
 
     for _, meas_dict in blocks.items():
         if not isinstance(meas_dict, dict):
@@ -140,23 +217,10 @@ def load_expected_sequence_by_measure(expected_path: Path) -> dict[int, list[int
                 meas = int(meas_key)
             except Exception:
                 continue
-            if not isinstance(events, list):
+            if not isinstance(events, list) or not events:
                 continue
 
-            for ev in events:
-                off = 0.0
-                midis = None
-
-                if isinstance(ev, dict):
-                    off = float(ev.get("offset", 0.0))
-                    midis = ev.get("midis", None)
-                elif isinstance(ev, (list, tuple)) and len(ev) >= 2:
-                    try:
-                        off = float(ev[0])
-                    except Exception:
-                        off = 0.0
-                    midis = ev[1]
-
+            for off, midis in _event_pairs(events):
                 if not midis:
                     continue
 
@@ -168,100 +232,140 @@ def load_expected_sequence_by_measure(expected_path: Path) -> dict[int, list[int
                         pass
 
                 if pcs:
-                    pcs_sorted = sorted(pcs)  # chord: stable order
-                    tmp[meas].append((off, pcs_sorted))
+                    offs_by_meas[meas].append(off)
+                    pcs_by_meas[meas].append(sorted(pcs))  # chord: stable order
 
-    out: dict[int, list[int]] = {}
-    for meas, items in tmp.items():
-        items.sort(key=lambda x: x[0])  # sort by offset within measure
-        seq: list[int] = []
-        for _, pcs in items:
-            seq.extend(pcs)
-        out[meas] = seq
+    out: dict[int, bytes] = {}
+    for meas, offs in offs_by_meas.items():
+        # stable argsort by offset within measure, flatten pc groups in order
+        order = np.argsort(np.asarray(offs, dtype=np.float64), kind="stable")
+        pcs_per_event = pcs_by_meas[meas]
+        out[meas] = bytes([pc for i in order for pc in pcs_per_event[i]])
 
     return out
 
 
-def parse_notes_txt(notes_txt: str) -> list[dict]:
+@dataclass(frozen=True)
+class DetectedNotes:
+    """
+    Detected note events as parallel arrays (SoA) instead of list-of-dicts,
+    so downstream binning/filtering stays in vectorized NumPy.
+    """
+    midi: np.ndarray   # int16
+    pc: np.ndarray     # uint8, midi % 12
+    onset: np.ndarray  # float64, seconds
+    dur: np.ndarray    # float64, seconds
+    vel: np.ndarray    # int16
+
+    def __len__(self) -> int:
+        return int(self.midi.size)
+
+
+def _empty_detected() -> DetectedNotes:
+    return DetectedNotes(
+        midi=np.empty(0, dtype=np.int16),
+        pc=np.empty(0, dtype=np.uint8),
+        onset=np.empty(0, dtype=np.float64),
+        dur=np.empty(0, dtype=np.float64),
+        vel=np.empty(0, dtype=np.int16),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_expected_cached(path_str: str, mtime_ns: int) -> dict[int, bytes]:
+    """
+    mtime-keyed cache so repeated compares during a practice loop skip the
+    JSON reparse while the sheet hasn't changed.
+    """
+    return load_expected_sequence_by_measure(Path(path_str))
+
+
+def parse_notes_txt(notes_txt: str) -> DetectedNotes:
     """
     Parse notes txt (Filtered notes) into events:
       idx midi name onset offset dur velocity
     We DO NOT validate rhythm; we use onset only for ordering / rough measure splitting.
+
+    Parsing is one np.loadtxt call (C-level) instead of a per-line Python
+    loop; header/placeholder lines are dropped first.
     """
-    evs = []
-    for line in notes_txt.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if line.lower().startswith("filtered notes"):
-            continue
-        if line.lower().startswith("idx"):
-            continue
+    rows = [ln for ln in notes_txt.splitlines() if ln.lstrip()[:1].isdigit()]
+    if not rows:
+        return _empty_detected()
 
-        parts = re.split(r"\s+", line)
-        if len(parts) < 7:
-            continue
+    try:
+        arr = np.loadtxt(StringIO("\n".join(rows)), usecols=(1, 3, 5, 6), dtype=np.float64, ndmin=2)
+    except Exception:
+        return _empty_detected()
 
-        try:
-            midi = int(parts[1])
-            onset = float(parts[3])
-            dur = float(parts[5])
-            vel = int(parts[6])
-        except Exception:
-            continue
+    midi = arr[:, 0].astype(np.int16)
+    onset = arr[:, 1]
+    dur = arr[:, 2]
+    vel = arr[:, 3].astype(np.int16)
 
-        if not (21 <= midi <= 108):
-            continue
+    mask = (midi >= 21) & (midi <= 108)
+    midi, onset, dur, vel = midi[mask], onset[mask], dur[mask], vel[mask]
+
+    order = np.argsort(onset, kind="stable")
+    midi, onset, dur, vel = midi[order], onset[order], dur[order], vel[order]
 
-        evs.append({"midi": midi, "pc": midi_to_pc(midi), "onset": onset, "dur": dur, "vel": vel})
-    evs.sort(key=lambda x: x["onset"])
-    return evs
+    return DetectedNotes(midi=midi, pc=(midi % 12).astype(np.uint8), onset=onset, dur=dur, vel=vel)
 
 
 def split_detected_into_measure_sequences(
-    evs: list[dict],
+    notes: DetectedNotes,
     *,
     meas_from: int,
     meas_to: int,
     min_velocity: int = 20,
     min_dur: float = 0.05,
-) -> dict[int, list[int]]:
+) -> dict[int, bytes]:
     """
     Split recording into N equal time bins (measures) and return per measure
-    a sequence of pitch-classes (ordered by onset).
+    a sequence of pitch-classes (ordered by onset) packed as bytes — one
+    byte per pc, so the matcher can use C-level bytes.find.
     Extras are fine; we keep them because the matcher will ignore them.
     """
-    out: dict[int, list[int]] = {m: [] for m in range(meas_from, meas_to + 1)}
-    if not evs:
+    out: dict[int, bytes] = {m: b"" for m in range(meas_from, meas_to + 1)}
+    if len(notes) == 0:
         return out
 
-    fevs = [e for e in evs if e["vel"] >= min_velocity and e["dur"] >= min_dur]
-    if not fevs:
+    mask = (notes.vel >= min_velocity) & (notes.dur >= min_dur)
+    onset = notes.onset[mask]
+    pc = notes.pc[mask]
+    if onset.size == 0:
         return out
 
-    t0 = fevs[0]["onset"]
-    t1 = fevs[-1]["onset"]
+    t0 = onset[0]
+    t1 = onset[-1]
     n_meas = (meas_to - meas_from + 1)
 
     total = max(1e-6, (t1 - t0))
     seg = total / n_meas
 
-    for e in fevs:
-        rel = e["onset"] - t0
-        idx = int(rel / seg) if seg > 0 else 0
-        if idx < 0:
-            idx = 0
-        if idx >= n_meas:
-            idx = n_meas - 1
-        meas = meas_from + idx
-        out[meas].append(int(e["pc"]))
+    # Equal-width binning: one multiply by the precomputed inverse per
+    # event, clipped in place, instead of a divide + two branches.
+    inv_seg = 1.0 / max(seg, 1e-12)
+    idx = (onset - t0) * inv_seg
+    np.clip(idx, 0, n_meas - 1, out=idx)
+    idx = idx.astype(np.int32, copy=False)
+
+    # Bucket in one pass: stable sort by measure keeps onset order within
+    # each bucket, then split at the bincount boundaries — no per-measure
+    # mask scan over all events.
+    order = np.argsort(idx, kind="stable")
+    pc_sorted = pc[order]
+    counts = np.bincount(idx, minlength=n_meas)
+    buckets = np.split(pc_sorted, np.cumsum(counts)[:-1])
+    for m in range(n_meas):
+        out[meas_from + m] = bytes(buckets[m])
 
     return out
 
 
 def match_sequence_with_lookahead(
-    expected: list[int],
-    detected: list[int],
+    expected: bytes,
+    detected: bytes,
     *,
     lookahead: int = 8,
 ) -> tuple[list[tuple[int, str, int | None]], int]:
@@ -270,23 +374,19 @@ def match_sequence_with_lookahead(
     Returns rows: (expected_pc, status, matched_detected_index_or_None)
     Extra detected notes are automatically ignored.
     Also returns 'used_detected' count (progress in detected).
+
+    Sequences are bytes (one pc per byte), so each window scan is a
+    C-level bytes.find instead of a Python loop.
     """
     rows: list[tuple[int, str, int | None]] = []
     j = 0
 
-<<<<<<< HEAD
+    if not isinstance(detected, bytes):
+        detected = bytes(detected)
 
-=======
->>>>>>> 737b4b7c88095d796ca11a98a156ec48d01dbc93
     for pc in expected:
-        found = None
-        # search forward within window
-        for k in range(j, min(len(detected), j + lookahead)):
-            if detected[k] == pc:
-                found = k
-                break
-
-        if found is None:
+        found = detected.find(pc, j, j + lookahead)
+        if found == -1:
             rows.append((pc, "MISS", None))
         else:
             rows.append((pc, "OK", found))
@@ -296,8 +396,8 @@ def match_sequence_with_lookahead(
 
 
 def build_feedback_table(
-    expected_by_meas: dict[int, list[int]],
-    detected_by_meas: dict[int, list[int]],
+    expected_by_meas: dict[int, bytes],
+    detected_by_meas: dict[int, bytes],
     meas_from: int,
     meas_to: int,
     *,
@@ -317,8 +417,8 @@ def build_feedback_table(
     total = 0
 
     for m in range(meas_from, meas_to + 1):
-        exp = expected_by_meas.get(m, [])
-        det = detected_by_meas.get(m, [])
+        exp = expected_by_meas.get(m, b"")
+        det = detected_by_meas.get(m, b"")
         if not exp:
             continue
 
@@ -347,76 +447,157 @@ class App(tk.Tk):
         self.geometry("980x740")
         self.minsize(880, 620)
 
+        # Lexical absolute paths are enough here; resolve() would lstat
+        # every component just to build a display string.
         self.audio_path: Path | None = None
-        self.outdir: Path = (Path.cwd() / "outputs").resolve()
+        self.outdir: Path = Path.cwd() / "outputs"
 
         # ✅ expected.json (sheet reference)
-        self.expected_path: Path = (Path.cwd() / "outputs" / "expected.json").resolve()
+        self.expected_path: Path = Path.cwd() / "outputs" / "expected.json"
         self.measure_from_var = tk.StringVar(value="1")
         self.measure_to_var = tk.StringVar(value="5")
 
         # Live mic state
         self.live_running = False
         self.live_stream = None
-        self.buf_lock = threading.Lock()
 
-        # record-from-start buffer (no window)
-        self.recorded_chunks: list[np.ndarray] = []
+        # record-from-start buffer (no window): preallocated scratch array
+        # plus a write cursor, so the sounddevice callback never allocates.
+        # 10 minutes at sample_rate; grown by doubling if ever exceeded.
+        self._rec_buf = np.empty(sample_rate * 60 * 10, dtype=np.float32)
+        self._rec_write = 0
 
         # UI lock to prevent double-click races
         self.ui_lock = False
 
+        # One persistent background worker for all transcription jobs:
+        # warmed model/import caches survive between runs and we skip the
+        # per-click thread-creation cost. Bounded so rapid clicks can't
+        # pile up a backlog of stale transcriptions.
+        self._jobs: queue.Queue = queue.Queue(maxsize=2)
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # TranscriptionApp cache keyed by (preset, write_chords, hop);
+        # touched only from the worker thread.
+        self._apps: dict[tuple[str, bool, float], object] = {}
+
+        # Original yscrollcommand per text box, saved while bulk-inserting.
+        self._saved_yscroll: dict = {}
+
+        # Last content shown per text box, so _set_text can diff-and-append
+        # instead of wiping and refilling the whole widget.
+        self._last_text: dict = {}
+
+        # Decoded output-file chunks keyed by (mtime_ns, size), so reloading
+        # an unchanged *_notes.txt / *_chords.txt skips the disk read.
+        self._out_chunks_cache: dict = {}
+
+        # Latest live result waiting for display; newer results overwrite
+        # older ones so the Tk queue holds at most one drain callback.
+        self._pending_live: tuple | None = None
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+
+        # Notes text of the last drained live result; sheet/compare are
+        # skipped when a drain carries the same notes again.
+        self._last_drained_notes: str | None = None
+
+        # Inputs of the last feedback comparison:
+        # (hash(notes_txt), m_from, m_to, expected mtime_ns).
+        self._last_compare_key: tuple | None = None
+
         # Keep reference to Tk image to prevent GC
         self._sheet_imgtk = None
 
+        # Sheet caching, two levels: (notes-hash, full-res PIL image) skips
+        # the music21 rasterization; ((notes-hash, w, h), PhotoImage) skips
+        # the re-thumbnail when the label size repeats too.
+        self._sheet_cache: tuple | None = None
+        self._sheet_thumb: tuple | None = None
+        self._sheet_notes: str | None = None
+        self._sheet_resize_after: str | None = None
+        # Notes-hash of a render currently queued on the worker, so repeat
+        # updates don't enqueue the same render twice.
+        self._sheet_render_key: str | None = None
+
         self._build_style()
         self._build_layout()
         self._toggle_hop()
         self._toggle_mode_ui()
         self._set_status("Ready.")
 
-        print("[GUI] Started. sample_rate =", sample_rate)
-        print("[GUI] Default outdir =", self.outdir)
-        print("[GUI] expected.json =", self.expected_path)
+        # Warm the audio driver off-thread: the first device open initializes
+        # the host API (typically 100-300 ms), so the first "Start Live Mic"
+        # would otherwise eat that delay inline.
+        threading.Thread(target=self._warm_audio, daemon=True).start()
+
+        logger.debug("Started. sample_rate=%s", sample_rate)
+        logger.debug("Default outdir=%s", self.outdir)
+        logger.debug("expected.json=%s", self.expected_path)
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_style(self):
         self.configure(bg="#0f172a")
         style = ttk.Style(self)
-        try:
-            style.theme_use("clam")
-        except Exception:
-            pass
-
-        style.configure(".", font=("SF Pro Text", 12))
-        style.configure("TLabel", background="#0f172a", foreground="#e5e7eb")
-        style.configure("TFrame", background="#0f172a")
-
-        style.configure("Header.TFrame", background="#0b1224")
-        style.configure("HeaderTitle.TLabel", background="#0b1224", foreground="#ffffff",
-                        font=("SF Pro Display", 18, "bold"))
-        style.configure("HeaderSub.TLabel", background="#0b1224", foreground="#cbd5e1")
 
-        style.configure("Card.TFrame", background="#111827", relief="flat")
-        style.configure("CardTitle.TLabel", background="#111827", foreground="#ffffff",
-                        font=("SF Pro Display", 13, "bold"))
-        
+        # Pre-resolve the fonts once and reuse the objects in every style
+        # entry (keeps Tk from doing a font lookup per configure call).
+        self._font_base = tkfont.Font(family="SF Pro Text", size=12)
+        self._font_bold = tkfont.Font(family="SF Pro Text", size=12, weight="bold")
+        self._font_title = tkfont.Font(family="SF Pro Display", size=18, weight="bold")
+        self._font_card = tkfont.Font(family="SF Pro Display", size=13, weight="bold")
+
+        # One theme_create is a single Tcl transaction instead of ~30
+        # separate configure/map round-trips.
+        settings = {
+            ".": {"configure": {"font": self._font_base}},
+            "TLabel": {"configure": {"background": "#0f172a", "foreground": "#e5e7eb"}},
+            "TFrame": {"configure": {"background": "#0f172a"}},
+
+            "Header.TFrame": {"configure": {"background": "#0b1224"}},
+            "HeaderTitle.TLabel": {"configure": {
+                "background": "#0b1224", "foreground": "#ffffff", "font": self._font_title,
+            }},
+            "HeaderSub.TLabel": {"configure": {"background": "#0b1224", "foreground": "#cbd5e1"}},
+
+            "Card.TFrame": {"configure": {"background": "#111827", "relief": "flat"}},
+            "CardTitle.TLabel": {"configure": {
+                "background": "#111827", "foreground": "#ffffff", "font": self._font_card,
+            }},
+
+            "TEntry": {"configure": {"fieldbackground": "#0b1224", "foreground": "#e5e7eb"}},
+            "TCombobox": {
+                "configure": {"fieldbackground": "#0b1224", "foreground": "#e5e7eb"},
+                "map": {"fieldbackground": [("readonly", "#0b1224")]},
+            },
+
+            "Primary.TButton": {
+                "configure": {
+                    "background": "#2563eb", "foreground": "#ffffff",
+                    "padding": (12, 8), "font": self._font_bold,
+                },
+                "map": {
+                    "background": [("active", "#1d4ed8"), ("disabled", "#334155")],
+                    "foreground": [("disabled", "#94a3b8")],
+                },
+            },
+
+            "TButton": {
+                "configure": {"background": "#1f2937", "foreground": "#e5e7eb", "padding": (10, 8)},
+                "map": {"background": [("active", "#374151")]},
+            },
+
+            "Status.TLabel": {"configure": {"background": "#0b1224", "foreground": "#cbd5e7eb"}},
+        }
 
-        style.configure("TEntry", fieldbackground="#0b1224", foreground="#e5e7eb")
-        style.configure("TCombobox", fieldbackground="#0b1224", foreground="#e5e7eb")
-        style.map("TCombobox", fieldbackground=[("readonly", "#0b1224")])
-
-        style.configure("Primary.TButton", background="#2563eb", foreground="#ffffff",
-                        padding=(12, 8), font=("SF Pro Text", 12, "bold"))
-        style.map("Primary.TButton",
-                  background=[("active", "#1d4ed8"), ("disabled", "#334155")],
-                  foreground=[("disabled", "#94a3b8")])
-
-        style.configure("TButton", background="#1f2937", foreground="#e5e7eb", padding=(10, 8))
-        style.map("TButton", background=[("active", "#374151")])
-
-        style.configure("Status.TLabel", background="#0b1224", foreground="#cbd5e7eb")
+        try:
+            style.theme_create("playcoach", parent="clam", settings=settings)
+        except tk.TclError:
+            # Theme already exists (second App in the same interpreter).
+            pass
+        style.theme_use("playcoach")
 
     def _build_layout(self):
         header = ttk.Frame(self, style="Header.TFrame", padding=(16, 14))
@@ -504,6 +685,7 @@ class App(tk.Tk):
         r3.pack(fill="x", pady=(0, 10))
         ttk.Label(r3, text="Hop (sec)", background="#111827").pack(side="left")
         self.hop_var = tk.StringVar(value="0.05")
+        self.hop_var.trace_add("write", self._validate_hop)
         self.hop_entry = ttk.Entry(r3, textvariable=self.hop_var, width=8)
         self.hop_entry.pack(side="right")
 
@@ -551,18 +733,21 @@ class App(tk.Tk):
         self.tabs.add(sheet_tab, text="Sheet")
         self.tabs.add(feedback_tab, text="Feedback")
 
-        self.notes_box = ScrolledText(notes_tab, height=18, wrap="none")
+        # undo=False: the boxes are display-only, and Tk's undo stack would
+        # otherwise record every programmatic insert/delete.
+        self.notes_box = ScrolledText(notes_tab, height=18, wrap="none", undo=False)
         self.notes_box.pack(fill="both", expand=True, padx=8, pady=8)
         self.notes_box.insert("end", "Notes output will appear here…\n")
 
-        self.chords_box = ScrolledText(chords_tab, height=14, wrap="none")
+        self.chords_box = ScrolledText(chords_tab, height=14, wrap="none", undo=False)
         self.chords_box.pack(fill="both", expand=True, padx=8, pady=8)
         self.chords_box.insert("end", "Chords output will appear here…\n")
 
         self.sheet_label = ttk.Label(sheet_tab)
         self.sheet_label.pack(fill="both", expand=True, padx=8, pady=8)
+        self.sheet_label.bind("<Configure>", self._on_sheet_resize)
 
-        self.feedback_box = ScrolledText(feedback_tab, height=14, wrap="none")
+        self.feedback_box = ScrolledText(feedback_tab, height=14, wrap="none", undo=False)
         self.feedback_box.pack(fill="both", expand=True, padx=8, pady=8)
         self.feedback_box.insert("end", "Feedback will appear here…\n")
 
@@ -577,15 +762,81 @@ class App(tk.Tk):
         self.progress = ttk.Progressbar(status_bar, mode="indeterminate", length=180)
         self.progress.pack(side="right")
 
+    def _warm_audio(self):
+        try:
+            # First sounddevice import loads the PortAudio DLL; doing it in
+            # this thread warms both the import and the driver.
+            import sounddevice as sd
+
+            s = sd.InputStream(samplerate=sample_rate, channels=1, dtype="float32")
+            s.start()
+            s.stop()
+            s.close()
+        except Exception:
+            # No input device (or busy) — start_live will surface the real
+            # error when the user actually needs the mic.
+            pass
+
+    def _worker_loop(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            finally:
+                self._jobs.task_done()
+
+    def _submit_job(self, job) -> None:
+        # Drop rather than block the Tk thread when the worker is saturated;
+        # the user can simply click again once the current run finishes.
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            self._set_busy(False)
+            self._set_status("Busy — previous run still in progress.")
+
+    def _get_app(self, preset: str, write_chords: bool, hop: float):
+        """
+        Reuse TranscriptionApp instances between runs (worker thread only),
+        so FilterConfig/FrameConfig and any model caches are built once.
+        """
+        key = (preset, write_chords, hop)
+        app = self._apps.get(key)
+        if app is None:
+            from transcribe.app import TranscriptionApp
+            from transcribe.frame import FrameConfig
+
+            app = TranscriptionApp(
+                filter_cfg=filter_cfg_from_preset(preset),
+                frame_cfg=FrameConfig(write_chords=write_chords, frame_hop=hop),
+                print_raw=False,
+                print_audio_info=False,
+            )
+            self._apps[key] = app
+        return app
+
+    def _hop_is_valid(self) -> bool:
+        # Hop only matters when chords are on.
+        if not self.chords_var.get():
+            return True
+        s = self.hop_var.get().strip()
+        # The regex admits "0"/"0.0"; hop must be strictly positive.
+        return _HOP_RE.fullmatch(s) is not None and float(s) > 0.0
+
+    def _validate_hop(self, *_):
+        # Validate on keystroke and disable Run instead of erroring on click.
+        if self.mode_var.get() == "file":
+            self.btn_run.configure(state=("normal" if self._hop_is_valid() else "disabled"))
+
     def _toggle_hop(self):
         self.hop_entry.configure(state=("normal" if self.chords_var.get() else "disabled"))
+        self._validate_hop()
 
     def _toggle_mode_ui(self):
         mode = self.mode_var.get()
         is_file = (mode == "file")
 
         self.btn_pick_audio.configure(state=("normal" if is_file else "disabled"))
-        self.btn_run.configure(state=("normal" if is_file else "disabled"))
+        self.btn_run.configure(state=("normal" if (is_file and self._hop_is_valid()) else "disabled"))
         self.btn_live.configure(state=("normal" if not is_file else "disabled"))
 
     def _set_status(self, text: str):
@@ -628,26 +879,107 @@ class App(tk.Tk):
         if path:
             self.expected_path = Path(path).expanduser().resolve()
             self.expected_label.config(text=str(self.expected_path))
-            print("[GUI] expected.json =", self.expected_path)
+            logger.debug("expected.json=%s", self.expected_path)
 
     def _update_sheet_from_notes_txt(self, notes_txt: str):
+        notes_key = hashlib.blake2b(notes_txt.encode(), digest_size=8).hexdigest()
+
+        # Full-res render cached -> only the cheap thumbnail/paste runs,
+        # safe to do right here on the Tk thread.
+        if self._sheet_cache is not None and self._sheet_cache[0] == notes_key:
+            self._sheet_notes = notes_txt
+            self._apply_sheet_image(notes_key, self._sheet_cache[1])
+            return
+
+        # Cache miss: the MuseScore rasterization takes hundreds of ms, so
+        # run it on the worker and marshal only the finished image back.
+        if self._sheet_render_key == notes_key:
+            return  # same render already in flight
+
+        self._sheet_render_key = notes_key
+
+        def render_job():
+            try:
+                from transcribe.sheet_render import render_grand_staff_from_notes_txt
+
+                img = render_grand_staff_from_notes_txt(notes_txt)
+            except Exception as e:
+                self.after(0, self._sheet_render_failed, notes_key, str(e))
+                return
+            self.after(0, self._sheet_render_done, notes_key, notes_txt, img)
+
         try:
-            img = render_grand_staff_from_notes_txt(notes_txt)
+            self._jobs.put_nowait(render_job)
+        except queue.Full:
+            # Transcriptions take priority; the stale sheet stays up and the
+            # next update retries.
+            self._sheet_render_key = None
+
+    def _sheet_render_done(self, notes_key: str, notes_txt: str, img):
+        if self._sheet_render_key == notes_key:
+            self._sheet_render_key = None
+        self._sheet_cache = (notes_key, img)
+        self._sheet_notes = notes_txt
+        self._apply_sheet_image(notes_key, img)
+
+    def _sheet_render_failed(self, notes_key: str, msg: str):
+        if self._sheet_render_key == notes_key:
+            self._sheet_render_key = None
+        self.sheet_label.configure(text=f"Sheet render error: {msg}", image="")
+        self._sheet_imgtk = None
+        self._sheet_cache = None
+        self._sheet_thumb = None
 
+    def _apply_sheet_image(self, notes_key: str, img):
+        try:
             w = max(300, self.sheet_label.winfo_width())
             h = max(200, self.sheet_label.winfo_height())
 
-            img = img.copy()
-            img.thumbnail((w - 20, h - 20))
-
-            self._sheet_imgtk = ImageTk.PhotoImage(img)
+            thumb_key = (notes_key, w, h)
+            if self._sheet_thumb is not None and self._sheet_thumb[0] == thumb_key:
+                self._sheet_imgtk = self._sheet_thumb[1]
+                self.sheet_label.configure(image=self._sheet_imgtk, text="")
+                return
+
+            from PIL import Image, ImageTk
+
+            thumb = img.copy()
+            thumb.thumbnail((w - 20, h - 20), Image.Resampling.LANCZOS)
+
+            # PhotoImage construction uploads pixels to Tk's image cache;
+            # when the size is unchanged (live updates), paste into the
+            # existing one instead of building a new object.
+            if (
+                self._sheet_imgtk is not None
+                and self._sheet_imgtk.width() == thumb.width
+                and self._sheet_imgtk.height() == thumb.height
+            ):
+                self._sheet_imgtk.paste(thumb)
+            else:
+                self._sheet_imgtk = ImageTk.PhotoImage(thumb)
+            self._sheet_thumb = (thumb_key, self._sheet_imgtk)
             self.sheet_label.configure(image=self._sheet_imgtk, text="")
         except Exception as e:
             self.sheet_label.configure(text=f"Sheet render error: {e}", image="")
             self._sheet_imgtk = None
+            self._sheet_thumb = None
+
+    def _on_sheet_resize(self, _event):
+        # Debounce: <Configure> fires for every pixel of an interactive
+        # resize; only the final size is worth a re-thumbnail.
+        if self._sheet_resize_after is not None:
+            self.after_cancel(self._sheet_resize_after)
+        self._sheet_resize_after = self.after(150, self._refit_sheet)
+
+    def _refit_sheet(self):
+        self._sheet_resize_after = None
+        if self._sheet_notes is not None:
+            self._update_sheet_from_notes_txt(self._sheet_notes)
 
     def _run_compare_and_show(self, notes_txt: str):
-        if not self.expected_path.exists():
+        try:
+            expected_st = self.expected_path.stat()
+        except OSError:
             self.feedback_box.delete("1.0", "end")
             self.feedback_box.insert("end", f"expected.json not found:\n{self.expected_path}\n")
             return
@@ -663,92 +995,25 @@ class App(tk.Tk):
             return
 
         try:
-            exp_seq_by_meas = load_expected_sequence_by_measure(self.expected_path)
+            exp_seq_by_meas = _load_expected_cached(str(self.expected_path), expected_st.st_mtime_ns)
         except Exception as e:
             self.feedback_box.delete("1.0", "end")
             self.feedback_box.insert("end", f"Could not read expected.json:\n{e}\n")
             return
 
-        exp_sel = {m: exp_seq_by_meas.get(m, []) for m in range(m_from, m_to + 1)}
-        if all(len(v) == 0 for v in exp_sel.values()):
+        # All compare inputs in one key: identical inputs mean an identical
+        # feedback table, so skip the parse/split/match entirely.
+        compare_key = (hash(notes_txt), m_from, m_to, expected_st.st_mtime_ns)
+        if compare_key == self._last_compare_key:
+            return
+        self._last_compare_key = compare_key
+
+        exp_sel = {m: exp_seq_by_meas.get(m, b"") for m in range(m_from, m_to + 1)}
+        # any() stops at the first non-empty measure
+        if not any(exp_sel.values()):
             self.feedback_box.delete("1.0", "end")
             self.feedback_box.insert("end", f"No expected notes found for measures {m_from}..{m_to}\n")
             return
-<<<<<<< HEAD
-        
-        evs = parse_notes_txt(notes_txt)
-        det_seq_by_meas = split_detected_into_measure_sequences(
-            evs, 
-            meas_from=m_from, 
-            meas_to=m_to
-        )
-
-        # Helper function to convert MIDI pitch to Note Name
-        def get_note_name(midi_pitch):
-            if midi_pitch is None: return "N/A"
-            # International Note Names
-            names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-            letter = names[midi_pitch % 12]
-            octave = (midi_pitch // 12) - 1
-            return f"{letter}{octave}"
-
-        # --- UPDATED LOGIC (ENGLISH & NOTE NAMES) ---
-        feedback_lines = []
-        skipped_notes = []
-
-        for m in range(m_from, m_to + 1):
-            exp_notes = exp_sel.get(m, [])
-            det_notes = det_seq_by_meas.get(m, [])
-            
-            i, j = 0, 0  # i = expected, j = detected
-            while i < len(exp_notes) and j < len(det_notes):
-                # Resolve Pitches
-                e_item = exp_notes[i]
-                e_pitch = e_item['pitch'] if isinstance(e_item, dict) else e_item
-                
-                d_item = det_notes[j]
-                d_pitch = d_item['pitch'] if isinstance(d_item, dict) else d_item
-                
-                e_name = get_note_name(e_pitch)
-                d_name = get_note_name(d_pitch)
-
-                # 1. Note is Correct
-                if e_pitch == d_pitch:
-                    feedback_lines.append(f"Measure {m}: Note {e_name} [OK]")
-                    i += 1
-                    j += 1
-                # 2. SKIP DETECTION: Is the next expected note the one played?
-                elif i + 1 < len(exp_notes):
-                    next_item = exp_notes[i+1]
-                    next_pitch = next_item['pitch'] if isinstance(next_item, dict) else next_item
-                    
-                    if next_pitch == d_pitch:
-                        feedback_lines.append(f"Measure {m}: Note {e_name} [SKIPPED!]")
-                        skipped_notes.append(f"Measure {m}: {e_name}")
-                        i += 2  # Sync to next note
-                        j += 1
-                    else:
-                        feedback_lines.append(f"Measure {m}: Wrong (Expected:{e_name} Played:{d_name})")
-                        i += 1
-                        j += 1
-                else:
-                    feedback_lines.append(f"Measure {m}: Wrong (Expected:{e_name} Played:{d_name})")
-                    i += 1
-                    j += 1
-
-        # Final Feedback Assembly (English)
-        feedback_text = "\n".join(feedback_lines)
-        if skipped_notes:
-            feedback_text += "\n\n--- SUMMARY ---"
-            feedback_text += "\nYou skipped the following notes:"
-            for note in skipped_notes:
-                feedback_text += f"\n  - {note}"
-        else:
-            feedback_text += "\n\n--- SUMMARY ---\nNo skips detected. Well done!"
-
-        self.feedback_box.delete("1.0", "end")
-        self.feedback_box.insert("end", feedback_text)
-=======
 
         evs = parse_notes_txt(notes_txt)
         det_seq_by_meas = split_detected_into_measure_sequences(
@@ -766,7 +1031,6 @@ class App(tk.Tk):
 
         self.feedback_box.delete("1.0", "end")
         self.feedback_box.insert("end", feedback)
->>>>>>> 737b4b7c88095d796ca11a98a156ec48d01dbc93
 
     def reset_all(self):
         if self.ui_lock:
@@ -776,6 +1040,10 @@ class App(tk.Tk):
         if self.live_running:
             self.stop_live()
 
+        self._last_text.clear()
+        self._last_drained_notes = None
+        self._last_compare_key = None
+
         self.notes_box.delete("1.0", "end")
         self.chords_box.delete("1.0", "end")
         self.feedback_box.delete("1.0", "end")
@@ -786,9 +1054,10 @@ class App(tk.Tk):
 
         self.sheet_label.configure(image="", text="")
         self._sheet_imgtk = None
+        self._sheet_thumb = None
+        self._sheet_notes = None
 
-        with self.buf_lock:
-            self.recorded_chunks.clear()
+        self._rec_write = 0
 
         self._set_busy(False)
         self._set_status("Reset ✅ (ready for new run)")
@@ -799,13 +1068,13 @@ class App(tk.Tk):
             filetypes=[("Audio", "*.wav *.mp3 *.ogg *.flac *.m4a"), ("All files", "*.*")]
         )
         if path:
-            self.audio_path = Path(path).expanduser().resolve()
+            self.audio_path = Path(os.path.abspath(os.path.expanduser(path)))
             self.audio_label.config(text=str(self.audio_path))
 
     def pick_outdir(self):
         folder = filedialog.askdirectory(title="Select output folder")
         if folder:
-            self.outdir = Path(folder).expanduser().resolve()
+            self.outdir = Path(os.path.abspath(os.path.expanduser(folder)))
             self.outdir_label.config(text=str(self.outdir))
 
     # --------------------
@@ -820,61 +1089,158 @@ class App(tk.Tk):
             messagebox.showerror("Missing file", "Please choose an audio file first.")
             return
 
+        # The hop trace keeps Run disabled while the entry is invalid,
+        # so the value is known-good here.
         write_chords = bool(self.chords_var.get())
-        try:
-            hop = float(self.hop_var.get()) if write_chords else 0.05
-            if write_chords and hop <= 0:
-                raise ValueError
-        except Exception:
-            messagebox.showerror("Invalid hop", "Hop must be a positive number (e.g. 0.05).")
-            return
+        hop = float(self.hop_var.get()) if write_chords else 0.05
 
         self._set_busy(True)
         self._set_status("Running file transcription…")
 
+        preset = self.preset_var.get()
+
         def job():
             try:
-                filter_cfg = filter_cfg_from_preset(self.preset_var.get())
-                frame_cfg = FrameConfig(write_chords=write_chords, frame_hop=hop)
                 self.outdir.mkdir(parents=True, exist_ok=True)
-
-                app = TranscriptionApp(
-                    filter_cfg=filter_cfg, frame_cfg=frame_cfg,
-                    print_raw=False, print_audio_info=False
-                )
+                app = self._get_app(preset, write_chords, hop)
 
                 stem = self.audio_path.stem
                 app.run(audio_path=self.audio_path, outdir=self.outdir, stem=stem)
 
-                self.after(0, lambda: self._load_outputs(stem, write_chords))
-                self.after(0, lambda: self._set_status("Done ✅"))
-                self.after(0, lambda: messagebox.showinfo("Done", "File transcription finished ✅"))
+                # One marshalled callback per completion: _finalize_file_run
+                # covers outputs, status and busy in a single idle task.
+                self.after(0, self._finalize_file_run, stem, write_chords)
 
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Error", str(e)))
-                self.after(0, lambda: self._set_status("Error."))
+                self.after(0, self._fail_run, "Error", str(e))
 
-            finally:
-                self.after(0, lambda: self._set_busy(False))
+        self._submit_job(job)
+
+    def _finalize_file_run(self, stem: str, write_chords: bool):
+        self._load_outputs(stem, write_chords)
+        self._set_busy(False)
+        self._set_status("Done ✅")
+        messagebox.showinfo("Done", "File transcription finished ✅")
+
+    def _fail_run(self, title: str, msg: str):
+        self._set_busy(False)
+        self._set_status("Error.")
+        messagebox.showerror(title, msg)
+
+    # Chunk size for streaming output files into the text boxes (bytes of text).
+    _TEXT_CHUNK = 65536
+
+    # Upper bound on lines kept in a text box. Tk's text widget slows down
+    # as total content grows; long sessions only ever need the tail.
+    _MAX_LINES = 2000
+
+    @staticmethod
+    def _read_text_chunks(path: Path) -> list[str]:
+        """
+        Read a text file as a list of chunks instead of one giant string,
+        so we never hold bytes + decoded str of the whole file at once.
+        """
+        chunks: list[str] = []
+        with open(path, "r", encoding="utf-8", buffering=App._TEXT_CHUNK) as f:
+            while True:
+                chunk = f.read(App._TEXT_CHUNK)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return chunks
+
+    def _read_text_chunks_cached(self, path: Path) -> list[str]:
+        """
+        Stat-keyed wrapper around _read_text_chunks: when the file's
+        (mtime_ns, size) match the last read, reuse the decoded chunks
+        instead of re-reading and re-decoding from disk.
+        """
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._out_chunks_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        chunks = self._read_text_chunks(path)
+        self._out_chunks_cache[path] = (key, chunks)
+        return chunks
+
+    def _detach_scroll(self, box: ScrolledText):
+        # Stop the scrollbar callback firing on every inserted chunk.
+        self._saved_yscroll[box] = box["yscrollcommand"]
+        box["yscrollcommand"] = ""
+
+    def _restore_scroll(self, box: ScrolledText):
+        box["yscrollcommand"] = self._saved_yscroll.pop(box, "")
+
+    def _append_chunks(self, box: ScrolledText, chunks: list[str]):
+        # One after(0, ...) per chunk keeps the Tk event loop responsive
+        # while a large output is being laid out. The scrollbar callback is
+        # detached for the duration so layout stays linear in output size.
+        self.after(0, self._detach_scroll, box)
+        for chunk in chunks:
+            self.after(0, box.insert, "end", chunk)
+        self.after(0, self._trim_box, box)
+        self.after(0, self._restore_scroll, box)
+
+    def _trim_box(self, box: ScrolledText):
+        # Drop leading lines once the widget exceeds _MAX_LINES.
+        overflow = int(box.index("end-1c").split(".")[0]) - self._MAX_LINES
+        if overflow > 0:
+            box.delete("1.0", f"{overflow + 1}.0")
+
+    def _set_text(self, box: ScrolledText, content: str):
+        """
+        Update box content by diffing against what was last shown: only the
+        tail after the common prefix is deleted and re-inserted, so Tk work
+        is O(delta) instead of O(total) — a pure append for the common
+        "new lines at the end" case, and a no-op when nothing changed.
+        """
+        # Cap before diffing so the widget and _last_text stay in sync.
+        if content.count("\n") >= self._MAX_LINES:
+            content = "\n".join(content.splitlines()[-self._MAX_LINES:]) + "\n"
+
+        last = self._last_text.get(box)
+        if content == last:
+            return
 
-        threading.Thread(target=job, daemon=True).start()
+        self._detach_scroll(box)
+        try:
+            if last is None:
+                box.delete("1.0", "end")
+                box.mark_set("insert", "1.0")
+                box.insert("1.0", content)
+            else:
+                k = len(os.path.commonprefix((last, content)))
+                box.delete(f"1.0 + {k}c", "end")
+                box.insert("end", content[k:])
+        finally:
+            self._restore_scroll(box)
+        self._last_text[box] = content
 
     def _load_outputs(self, stem: str, write_chords: bool):
         notes_txt = self.outdir / f"{stem}_notes.txt"
         chords_txt = self.outdir / f"{stem}_chords.txt"
 
-        notes_content = notes_txt.read_text(encoding="utf-8") if notes_txt.exists() else "No notes txt created."
+        if notes_txt.exists():
+            notes_chunks = self._read_text_chunks_cached(notes_txt)
+        else:
+            notes_chunks = ["No notes txt created."]
         if write_chords and chords_txt.exists():
-            chords_content = chords_txt.read_text(encoding="utf-8")
+            chords_chunks = self._read_text_chunks_cached(chords_txt)
         else:
-            chords_content = "(Chords disabled or chords file not created.)"
+            chords_chunks = ["(Chords disabled or chords file not created.)"]
+
+        # Bulk chunk path bypasses _set_text's diffing; drop its cache.
+        self._last_text.pop(self.notes_box, None)
+        self._last_text.pop(self.chords_box, None)
 
         self.notes_box.delete("1.0", "end")
-        self.notes_box.insert("end", notes_content)
+        self._append_chunks(self.notes_box, notes_chunks)
 
         self.chords_box.delete("1.0", "end")
-        self.chords_box.insert("end", chords_content)
+        self._append_chunks(self.chords_box, chords_chunks)
 
+        notes_content = "".join(notes_chunks)
         self._update_sheet_from_notes_txt(notes_content)
 
         # ✅ per-note feedback (order-based)
@@ -884,9 +1250,21 @@ class App(tk.Tk):
     # Live mic mode
     # --------------------
     def _audio_callback(self, indata, frames, time_info, status):
-        x = indata[:, 0].astype(np.float32).copy()
-        with self.buf_lock:
-            self.recorded_chunks.append(x)
+        # Lock-free by design: this callback is the only writer, and the
+        # buffer is only read/reset while the stream is stopped, so there is
+        # no mutex on the realtime audio thread (attribute stores of ints
+        # are atomic under the GIL anyway).
+        #
+        # RawInputStream hands us a CFFI buffer; frombuffer wraps it as a
+        # zero-copy float32 view (mono, so no channel slicing needed).
+        x = np.frombuffer(indata, dtype=np.float32, count=frames)
+        end = self._rec_write + frames
+        if end > self._rec_buf.size:
+            grown = np.empty(max(self._rec_buf.size * 2, end), dtype=np.float32)
+            grown[:self._rec_write] = self._rec_buf[:self._rec_write]
+            self._rec_buf = grown
+        self._rec_buf[self._rec_write:end] = x
+        self._rec_write = end
 
     def toggle_live(self):
         if self.ui_lock:
@@ -901,28 +1279,63 @@ class App(tk.Tk):
     def start_live(self):
         self.outdir.mkdir(parents=True, exist_ok=True)
 
-        with self.buf_lock:
-            self.recorded_chunks.clear()
+        # Stream is not running yet; safe to reset the cursor directly.
+        self._rec_write = 0
 
         self.live_running = True
         self.btn_live.configure(text="Stop + Analyze")
         self._set_status("Listening… (press Stop + Analyze when done)")
         self._set_busy(True)
 
-        self.live_stream = sd.InputStream(
+        import sounddevice as sd
+
+        # RawInputStream skips sounddevice's per-callback ndarray allocation.
+        self.live_stream = sd.RawInputStream(
             samplerate=sample_rate,
+            blocksize=1024,  # fixed power-of-two blocks: deterministic per-callback cost
             channels=1,
             dtype="float32",
+            latency="low",  # ask PortAudio for its low-latency host buffers
             callback=self._audio_callback,
         )
         self.live_stream.start()
 
     def _show_live(self, notes: str, chords: str):
-        self.notes_box.delete("1.0", "end")
-        self.notes_box.insert("end", notes)
+        self._set_text(self.notes_box, notes)
+        self._set_text(self.chords_box, chords)
+
+    def _post_live_result(self, notes: str, chords: str, status: str):
+        """
+        Called from the worker thread. Coalesces UI updates: only the newest
+        result is kept and at most one drain callback is queued, posted via
+        after_idle so Tk's own redraws aren't starved.
+        """
+        with self._pending_lock:
+            self._pending_live = (notes, chords, status)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.after_idle(self._drain_live_result)
+
+    def _drain_live_result(self):
+        with self._pending_lock:
+            result = self._pending_live
+            self._pending_live = None
+            self._drain_scheduled = False
+        if result is None:
+            return
 
-        self.chords_box.delete("1.0", "end")
-        self.chords_box.insert("end", chords)
+        notes, chords, status = result
+        self._show_live(notes, chords)
+        # Sheet rendering and compare are the expensive part of a drain;
+        # if the notes text is byte-identical to the last drained result
+        # they would recompute the same outputs, so skip them.
+        if notes != self._last_drained_notes:
+            self._last_drained_notes = notes
+            self._update_sheet_from_notes_txt(notes)
+            self._run_compare_and_show(notes)
+        self._set_busy(False)
+        self._set_status(status)
 
     def stop_live(self):
         self.live_running = False
@@ -939,54 +1352,43 @@ class App(tk.Tk):
         self._set_status("Analyzing last take…")
         self._set_busy(True)
 
-        with self.buf_lock:
-            audio = np.concatenate(self.recorded_chunks, axis=0) if self.recorded_chunks else np.zeros(0, dtype=np.float32)
+        # Stream stopped above, so no writer is running; copy out so a new
+        # take can start while this one is analyzed.
+        audio = self._rec_buf[:self._rec_write].copy()
+
+        preset = self.preset_var.get()
+        write_chords = bool(self.chords_var.get())
+        # Live mode has no keystroke gate on the hop entry, so parse it
+        # defensively here: a garbage value must not blow up the Stop
+        # callback after the stream is already down — fall back to the
+        # 0.05 default instead.
+        hop = 0.05
+        if write_chords and self._hop_is_valid():
+            hop = float(self.hop_var.get())
 
         def job():
             try:
                 if audio.size == 0 or len(audio) < int(0.2 * sample_rate):
                     empty_notes = "Filtered notes\n\n(No audio captured — press Start and play a bit)\n"
                     empty_chords = "Chord segments (frame-based)\n\n(No audio captured)\n"
-                    self.after(0, lambda: self._show_live(empty_notes, empty_chords))
-                    self.after(0, lambda: self._update_sheet_from_notes_txt(empty_notes))
-                    self.after(0, lambda: self._run_compare_and_show(empty_notes))
-                    self.after(0, lambda: self._set_status("Done ✅ (no audio)"))
+                    self._post_live_result(empty_notes, empty_chords, "Done ✅ (no audio)")
                     return
 
-                filter_cfg = filter_cfg_from_preset(self.preset_var.get())
-                frame_cfg = FrameConfig(
-                    write_chords=bool(self.chords_var.get()),
-                    frame_hop=float(self.hop_var.get()),
-                )
-
-                app = TranscriptionApp(
-                    filter_cfg=filter_cfg,
-                    frame_cfg=frame_cfg,
-                    print_raw=False,
-                    print_audio_info=False,
-                )
+                app = self._get_app(preset, write_chords, hop)
 
                 stem = "live"
-                app.run_audio(audio, outdir=self.outdir, stem=stem)
-
-                notes_path = self.outdir / f"{stem}_notes.txt"
-                chords_path = self.outdir / f"{stem}_chords.txt"
+                # run_audio hands the text back directly — no need to
+                # round-trip through the files it just wrote.
+                notes, chords = app.run_audio(audio, outdir=self.outdir, stem=stem)
+                if chords is None:
+                    chords = "(no chords)"
 
-                notes = notes_path.read_text(encoding="utf-8") if notes_path.exists() else "(no notes)"
-                chords = chords_path.read_text(encoding="utf-8") if chords_path.exists() else "(no chords)"
-
-                self.after(0, lambda n=notes, c=chords: self._show_live(n, c))
-                self.after(0, lambda n=notes: self._update_sheet_from_notes_txt(n))
-                self.after(0, lambda n=notes: self._run_compare_and_show(n))
-                self.after(0, lambda: self._set_status("Done ✅"))
+                self._post_live_result(notes, chords, "Done ✅")
 
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Live error", str(e)))
-                self.after(0, lambda: self._set_status("Error."))
-            finally:
-                self.after(0, lambda: self._set_busy(False))
+                self.after(0, self._fail_run, "Live error", str(e))
 
-        threading.Thread(target=job, daemon=True).start()
+        self._submit_job(job)
 
     def _on_close(self):
         try:
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import json
+import statistics
 import subprocess
 import sys
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from collections import defaultdict, Counter
 
-from music21 import converter, note, chord, stream
+import numpy as np
+
+# music21 is imported lazily inside _extract_with_music21: it takes seconds
+# to import and the streaming parser path (and --help) never needs it.
 
 
 # -------------------------
@@ -36,39 +41,58 @@ def run_oemer(image_path: Path, workdir: Path) -> Path:
 # -------------------------
 # 2) Helpers
 # -------------------------
+# Precomputed names for all 128 MIDI values: midi_to_name is called once per
+# note in printing and JSON export, and a fresh music21 note.Note() per call
+# is pure allocation overhead. Matches nameWithOctave's sharp spelling.
+_NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_MIDI_NAMES = tuple(f"{_NOTE_NAMES[m % 12]}{(m // 12) - 1}" for m in range(128))
+
+
 def midi_to_name(m: int) -> str:
-    n = note.Note()
-    n.pitch.midi = int(m)
-    return n.nameWithOctave
+    return _MIDI_NAMES[int(m)]
 
 
 def group_midis_by_offset(items, tol=1e-6):
     """
     items: list of (offset, [midi...])
     returns grouped: list of (offset, sorted_unique_midis)
-    """
-    items = sorted(items, key=lambda x: x[0])
-    grouped = []
-    cur_off = None
-    cur_set = set()
-
-    for off, midis in items:
-        off = float(off)
-        if cur_off is None:
-            cur_off = off
-
-        if abs(off - cur_off) <= tol:
-            for m in midis:
-                cur_set.add(int(m))
-        else:
-            grouped.append((cur_off, sorted(cur_set)))
-            cur_off = off
-            cur_set = set(int(m) for m in midis)
 
-    if cur_off is not None:
-        grouped.append((cur_off, sorted(cur_set)))
-
-    return grouped
+    Vectorized: one stable argsort over the offsets, group boundaries from
+    np.diff > tol, then np.split + np.unique per group — the hot loop runs
+    in NumPy instead of per-event Python.
+    """
+    n = len(items)
+    if n == 0:
+        return []
+
+    offs = np.empty(n, dtype=np.float64)
+    counts = np.empty(n, dtype=np.intp)
+    midis_flat = []
+    for i, (off, midis) in enumerate(items):
+        offs[i] = off
+        counts[i] = len(midis)
+        midis_flat.extend(midis)
+
+    order = np.argsort(offs, kind="stable")
+    sorted_offs = offs[order]
+    breaks = np.nonzero(np.diff(sorted_offs) > tol)[0] + 1
+
+    # Reorder the flattened midis to match the sorted item order.
+    midis_arr = np.asarray(midis_flat, dtype=np.int64)
+    rank = np.empty(n, dtype=np.intp)
+    rank[order] = np.arange(n)
+    midi_order = np.argsort(np.repeat(rank, counts), kind="stable")
+    sorted_midis = midis_arr[midi_order]
+
+    # Item-level breaks -> positions in the flattened midi array.
+    counts_sorted = counts[order]
+    midi_breaks = np.cumsum(counts_sorted)[breaks - 1] if len(breaks) else []
+
+    starts = np.concatenate(([0], breaks)).astype(np.intp)
+    return [
+        (float(sorted_offs[s]), np.unique(g).tolist())
+        for s, g in zip(starts, np.split(sorted_midis, midi_breaks))
+    ]
 
 
 def part_pitch_profile(part) -> float:
@@ -76,18 +100,19 @@ def part_pitch_profile(part) -> float:
     Rough heuristic: median MIDI pitch of a part.
     Used to guess RH vs LH if parts are not labeled.
     """
+    # .flatten().notes is music21's fast accessor: it visits only
+    # notes/chords instead of recurse()-ing through every element.
     pitches = []
-    for el in part.recurse():
-        if isinstance(el, note.Note):
-            pitches.append(int(el.pitch.midi))
-        elif isinstance(el, chord.Chord):
-            pitches.extend(int(p.midi) for p in el.pitches)
+    for n in part.flatten().notes:
+        if n.isChord:
+            pitches.extend(int(p.midi) for p in n.pitches)
+        else:
+            pitches.append(int(n.pitch.midi))
 
     if not pitches:
         return 0.0
 
-    pitches.sort()
-    return pitches[len(pitches) // 2]
+    return statistics.median_low(pitches)
 
 
 def assign_hands(score):
@@ -113,14 +138,133 @@ def assign_hands(score):
 # -------------------------
 # 3) Extraction: By Hand -> Measure -> Offset
 # -------------------------
-def extract_piano_events(musicxml_path: Path, offset_tol=1e-6, midi_min=21, midi_max=108):
+_STEP_TO_PC = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+
+def _stream_piano_events(musicxml_path: Path, midi_min: int, midi_max: int):
     """
-    Returns dict:
-      {
-        "RH": { measure_no: [(offset_in_measure, [midis...]), ...] },
-        "LH": { measure_no: [(offset_in_measure, [midis...]), ...] }
-      }
+    One-pass streaming MusicXML reader (score-partwise).
+
+    Returns (parts, medians):
+      parts:   list (document order) of {measure_no: [(offset_ql, [midis...])]}
+      medians: list of median MIDI pitch per part (for hand assignment)
+
+    Only (measure, offset, midi) is needed downstream, so this skips
+    music21 entirely — no Stream/Note object per element, just one
+    iterparse pass with a running duration cursor. Handles <divisions>,
+    <backup>/<forward>, <chord/>, grace notes and rests.
     """
+    parts = []
+    pitches_per_part = []
+
+    cur = None
+    cur_pitches = None
+    divisions = 1.0
+    cursor = 0.0
+    last_start = 0.0
+    meas_no = 0
+
+    for event, elem in ET.iterparse(str(musicxml_path), events=("start", "end")):
+        tag = elem.tag.rpartition("}")[2]
+
+        if event == "start":
+            if tag == "part":
+                cur = defaultdict(list)
+                cur_pitches = []
+                parts.append(cur)
+                pitches_per_part.append(cur_pitches)
+                divisions = 1.0
+                meas_no = 0
+            elif tag == "measure" and cur is not None:
+                try:
+                    meas_no = int(elem.attrib.get("number", meas_no + 1))
+                except ValueError:
+                    meas_no += 1
+                cursor = 0.0
+                last_start = 0.0
+            elif tag == "score-timewise":
+                # Cursor bookkeeping below assumes partwise layout.
+                raise ValueError("score-timewise MusicXML (use the music21 parser)")
+            continue
+
+        if cur is None:
+            continue
+
+        if tag == "note":
+            dur = 0.0
+            is_chord = is_rest = is_grace = False
+            step = None
+            alter = 0
+            octave = None
+
+            for child in elem:
+                t = child.tag.rpartition("}")[2]
+                if t == "duration":
+                    dur = float(child.text)
+                elif t == "chord":
+                    is_chord = True
+                elif t == "rest":
+                    is_rest = True
+                elif t == "grace":
+                    is_grace = True
+                elif t == "pitch":
+                    for pc in child:
+                        pt = pc.tag.rpartition("}")[2]
+                        if pt == "step":
+                            step = pc.text.strip()
+                        elif pt == "alter":
+                            alter = int(float(pc.text))
+                        elif pt == "octave":
+                            octave = int(pc.text)
+
+            # Chord members share the onset of the note that opened the chord.
+            start = last_start if is_chord else cursor
+
+            if not is_rest and step is not None and octave is not None:
+                m = 12 * (octave + 1) + _STEP_TO_PC[step] + alter
+                if midi_min <= m <= midi_max:
+                    cur[meas_no].append((start, [m]))
+                    cur_pitches.append(m)
+
+            if not is_chord:
+                last_start = cursor
+                if not is_grace:
+                    cursor += dur / divisions
+            elem.clear()
+
+        elif tag == "divisions":
+            divisions = float(elem.text)
+
+        elif tag == "backup" or tag == "forward":
+            for child in elem:
+                if child.tag.rpartition("}")[2] == "duration":
+                    step_ql = float(child.text) / divisions
+                    cursor += step_ql if tag == "forward" else -step_ql
+            elem.clear()
+
+        elif tag == "measure":
+            elem.clear()
+
+    return parts, [
+        sorted(p)[len(p) // 2] if p else 0.0 for p in pitches_per_part
+    ]
+
+
+def _hands_from_medians(medians):
+    """Same RH/LH heuristic as assign_hands, from precomputed medians."""
+    if len(medians) == 0:
+        return {"RH": None, "LH": None}
+    if len(medians) == 1:
+        return {"RH": 0, "LH": 0}
+
+    order = sorted(range(len(medians)), key=lambda i: medians[i])  # low -> high
+    return {"RH": order[-1], "LH": order[0]}
+
+
+def _extract_with_music21(musicxml_path: Path, offset_tol, midi_min, midi_max):
+    """Legacy music21 extraction; handles .mxl and anything iterparse can't."""
+    from music21 import converter, stream
+
     score = converter.parse(str(musicxml_path))
     hand_map = assign_hands(score)
 
@@ -138,16 +282,16 @@ def extract_piano_events(musicxml_path: Path, offset_tol=1e-6, midi_min=21, midi
 
             # collect raw events inside this measure
             raw = []
-            for el in meas.recurse():
-                if isinstance(el, note.Note):
-                    m = int(el.pitch.midi)
-                    if midi_min <= m <= midi_max:
-                        raw.append((float(el.offset), [m]))
-                elif isinstance(el, chord.Chord):
+            for el in meas.flatten().notes:
+                if el.isChord:
                     midis = [int(p.midi) for p in el.pitches]
                     midis = [m for m in midis if midi_min <= m <= midi_max]
                     if midis:
                         raw.append((float(el.offset), midis))
+                else:
+                    m = int(el.pitch.midi)
+                    if midi_min <= m <= midi_max:
+                        raw.append((float(el.offset), [m]))
 
             # group to chord-events & dedupe duplicates
             grouped = group_midis_by_offset(raw, tol=offset_tol)
@@ -156,22 +300,106 @@ def extract_piano_events(musicxml_path: Path, offset_tol=1e-6, midi_min=21, midi
     return out, hand_map
 
 
+def extract_piano_events(
+    musicxml_path: Path,
+    offset_tol=1e-6,
+    midi_min=21,
+    midi_max=108,
+    legacy_parser=False,
+):
+    """
+    Returns dict:
+      {
+        "RH": { measure_no: [(offset_in_measure, [midis...]), ...] },
+        "LH": { measure_no: [(offset_in_measure, [midis...]), ...] }
+      }
+
+    Plain .musicxml/.xml goes through the streaming reader (no music21
+    object graph — much faster on large scores); .mxl (zipped) and
+    --legacy-parser fall back to converter.parse().
+    """
+    musicxml_path = Path(musicxml_path)
+
+    if not legacy_parser and musicxml_path.suffix.lower() != ".mxl":
+        try:
+            parts, medians = _stream_piano_events(musicxml_path, midi_min, midi_max)
+        except (ET.ParseError, ValueError, KeyError):
+            pass  # malformed/unexpected layout: let music21 have a go
+        else:
+            hand_map = _hands_from_medians(medians)
+            out = {"RH": defaultdict(list), "LH": defaultdict(list)}
+            for hand in ["RH", "LH"]:
+                p_idx = hand_map[hand]
+                if p_idx is None:
+                    continue
+                for meas_no, raw in parts[p_idx].items():
+                    out[hand][meas_no] = group_midis_by_offset(raw, tol=offset_tol)
+            return out, hand_map
+
+    return _extract_with_music21(musicxml_path, offset_tol, midi_min, midi_max)
+
+
+def _process_one(image_path: Path, workdir: Path, midi_min: int, midi_max: int,
+                 legacy_parser: bool = False):
+    """run_batch worker: oemer + extraction for a single image."""
+    mx = run_oemer(image_path, workdir)
+    events_by_hand, hand_map = extract_piano_events(
+        mx, midi_min=midi_min, midi_max=midi_max, legacy_parser=legacy_parser
+    )
+    return mx, events_by_hand, hand_map
+
+
+def run_batch(images, workdir: Path, *, midi_min=21, midi_max=108,
+              workers=None, legacy_parser=False):
+    """
+    Process several sheet images in parallel.
+
+    oemer is single-threaded per invocation, so images scale across cores
+    with a process pool. Each image gets its own sub-workdir: run_oemer's
+    newest-file glob would race if two invocations shared a directory.
+
+    Returns {image_path: (musicxml_path, events_by_hand, hand_map)}.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = {
+            ex.submit(
+                _process_one, img, workdir / f"img_{i:03d}",
+                midi_min, midi_max, legacy_parser,
+            ): img
+            for i, img in enumerate(images)
+        }
+        for fut in as_completed(futures):
+            results[futures[fut]] = fut.result()
+    return results
+
+
 # -------------------------
 # 4) Pretty print
 # -------------------------
 def print_events(events_by_hand, hand_map):
-    print("\n=== Hand assignment ===")
-    print(f"RH part index: {hand_map['RH']}")
-    print(f"LH part index: {hand_map['LH']}")
+    # Assemble everything and write once: one syscall instead of one
+    # print() (and stdout lock/flush) per event line.
+    lines = [
+        "\n=== Hand assignment ===",
+        f"RH part index: {hand_map['RH']}",
+        f"LH part index: {hand_map['LH']}",
+    ]
 
     for hand in ["RH", "LH"]:
-        print(f"\n=== {hand} (by Measure -> Offset) ===")
+        lines.append(f"\n=== {hand} (by Measure -> Offset) ===")
         measures = sorted(events_by_hand[hand].keys())
         for meas_no in measures:
-            print(f"\n-- Measure {meas_no} --")
-            for off, midis in events_by_hand[hand][meas_no]:
-                names = [midi_to_name(m) for m in midis]
-                print(f"{off:6.3f} | {names}")
+            lines.append(f"\n-- Measure {meas_no} --")
+            lines.extend(
+                f"{off:6.3f} | [{', '.join(_MIDI_NAMES[m] for m in midis)}]"
+                for off, midis in events_by_hand[hand][meas_no]
+            )
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 # -------------------------
@@ -225,10 +453,25 @@ def save_expected_json(
 def main():
     import argparse
     ap = argparse.ArgumentParser()
-    ap.add_argument("image", help="Path to PNG/JPG of sheet music (best: clear, cropped, straight)")
+    ap.add_argument(
+        "image",
+        nargs="+",
+        help="Path(s) to PNG/JPG of sheet music (best: clear, cropped, straight)",
+    )
     ap.add_argument("--workdir", default="outputs_oemer", help="Where oemer writes outputs")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process-pool size when multiple images are given (default: one per core)",
+    )
     ap.add_argument("--midi-min", type=int, default=21, help="Lowest MIDI allowed (piano A0=21)")
     ap.add_argument("--midi-max", type=int, default=108, help="Highest MIDI allowed (piano C8=108)")
+    ap.add_argument(
+        "--legacy-parser",
+        action="store_true",
+        help="Parse MusicXML via music21 instead of the streaming reader",
+    )
 
     # ✅ NEW: save expected notes for GUI
     ap.add_argument(
@@ -239,8 +482,36 @@ def main():
 
     args = ap.parse_args()
 
-    img = Path(args.image).expanduser().resolve()
+    images = [Path(p).expanduser().resolve() for p in args.image]
     workdir = Path(args.workdir).expanduser().resolve()
+    out_json = Path(args.out_json).expanduser().resolve()
+
+    if len(images) > 1:
+        # Batch: oemer + extraction per image across a process pool; each
+        # image writes its own expected_<stem>.json next to --out-json.
+        results = run_batch(
+            images,
+            workdir,
+            midi_min=args.midi_min,
+            midi_max=args.midi_max,
+            workers=args.workers,
+            legacy_parser=args.legacy_parser,
+        )
+        for img in images:
+            mx, events_by_hand, hand_map = results[img]
+            print(f"✅ MusicXML: {mx}")
+            save_expected_json(
+                out_json.with_name(f"{out_json.stem}_{img.stem}{out_json.suffix}"),
+                sheet_image=img,
+                musicxml_path=mx,
+                hand_map=hand_map,
+                events_by_hand=events_by_hand,
+                midi_min=args.midi_min,
+                midi_max=args.midi_max,
+            )
+        return
+
+    img = images[0]
 
     mx = run_oemer(img, workdir)
     print(f"✅ MusicXML: {mx}")
@@ -249,13 +520,13 @@ def main():
         mx,
         offset_tol=1e-6,
         midi_min=args.midi_min,
-        midi_max=args.midi_max
+        midi_max=args.midi_max,
+        legacy_parser=args.legacy_parser,
     )
 
     print_events(events_by_hand, hand_map)
 
     # ✅ NEW: write expected.json
-    out_json = Path(args.out_json).expanduser().resolve()
     save_expected_json(
         out_json,
         sheet_image=img,
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
+import functools
+import shutil
+import sys
 from pathlib import Path
 import music21 as m21
 
 
+@functools.lru_cache(maxsize=1)
 def find_musescore_executable() -> Path | None:
     """
-    Tries common MuseScore 4 locations on macOS.
-    Returns the first existing executable path.
+    Finds the MuseScore executable for the current platform.
+    Returns the first existing path (cached — the stat calls add up when
+    callers probe repeatedly).
     """
-    candidates = [
-        # Common MuseScore 4 bundle names
-        Path("/Applications/MuseScore 4.app/Contents/MacOS/mscore"),
-        Path("/Applications/MuseScore 4.app/Contents/MacOS/MuseScore4"),
-        Path("/Applications/MuseScore 4.app/Contents/MacOS/MuseScore"),
-        Path("/Applications/MuseScore.app/Contents/MacOS/mscore"),
-        Path("/Applications/MuseScore.app/Contents/MacOS/MuseScore4"),
-        Path("/Applications/MuseScore.app/Contents/MacOS/MuseScore"),
-    ]
+    # PATH first: cheapest and covers package-manager installs everywhere.
+    for name in ("mscore", "musescore", "MuseScore4"):
+        exe = shutil.which(name)
+        if exe:
+            return Path(exe)
+
+    if sys.platform == "darwin":
+        candidates = [
+            # Common MuseScore 4 bundle names
+            Path("/Applications/MuseScore 4.app/Contents/MacOS/mscore"),
+            Path("/Applications/MuseScore 4.app/Contents/MacOS/MuseScore4"),
+            Path("/Applications/MuseScore 4.app/Contents/MacOS/MuseScore"),
+            Path("/Applications/MuseScore.app/Contents/MacOS/mscore"),
+            Path("/Applications/MuseScore.app/Contents/MacOS/MuseScore4"),
+            Path("/Applications/MuseScore.app/Contents/MacOS/MuseScore"),
+        ]
+    elif sys.platform == "win32":
+        candidates = [
+            Path("C:/Program Files/MuseScore 4/bin/MuseScore4.exe"),
+            Path("C:/Program Files/MuseScore 3/bin/MuseScore3.exe"),
+        ]
+    else:
+        candidates = [
+            Path("/usr/bin/mscore"),
+            Path("/usr/bin/musescore"),
+            Path("/usr/local/bin/mscore"),
+        ]
 
     for p in candidates:
         if p.exists():
@@ -1,16 +1,57 @@
 from __future__ import annotations
 
+import hashlib
+import pickle
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
-import librosa
-from piano_transcription_inference import PianoTranscription, sample_rate
 
 from .filters import NoteFilters, FilterConfig
 from .frame import FrameConfig, FrameChordExtractor, FrameChord, ChordSegment
 from .io_utils import IOWriter
 
+# piano_transcription_inference.sample_rate — fixed by the model checkpoint;
+# hardcoded so importing this module (and torch with it) stays cheap. The
+# library itself is imported lazily in _get_transcriptor.
+sample_rate = 16000
+
+# Loaded PianoTranscription models, one per device (see _get_transcriptor).
+_transcriptors: dict = {}
+
+
+def _load_audio_mono(audio_path: Path) -> np.ndarray:
+    """
+    Load audio as float32 mono at sample_rate.
+
+    soundfile reads straight into a float32 buffer via libsndfile and skips
+    librosa's always-on resampler pass; resampling only happens when the
+    file's rate actually differs. librosa remains the fallback for formats
+    libsndfile can't open (e.g. m4a on older builds).
+    """
+    try:
+        import soundfile as sf
+
+        audio, sr = sf.read(str(audio_path), dtype="float32", always_2d=False)
+    except Exception:
+        import librosa
+
+        audio, _ = librosa.load(str(audio_path), sr=sample_rate, mono=True)
+        return np.asarray(audio, dtype=np.float32).reshape(-1)
+
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    if sr != sample_rate:
+        try:
+            import soxr
+
+            audio = soxr.resample(audio, sr, sample_rate)
+        except ImportError:
+            import librosa
+
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=sample_rate)
+    return np.asarray(audio, dtype=np.float32).reshape(-1)
+
 
 class TranscriptionApp:
     """
@@ -30,8 +71,15 @@ class TranscriptionApp:
         frame_cfg: FrameConfig,
         print_raw: bool = False,
         print_audio_info: bool = False,
+        device: Optional[str] = None,
     ):
-        self.device = "cpu"  # fixed for now
+        if device is None:
+            # The transcription CNN is memory-bound on CPU and an order of
+            # magnitude faster on any recent GPU, so prefer CUDA when there.
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
 
         self.filter_cfg = filter_cfg
         self.frame_cfg = frame_cfg
@@ -42,6 +90,20 @@ class TranscriptionApp:
         self.frame_extractor = FrameChordExtractor()
         self.io = IOWriter()
 
+    def _get_transcriptor(self):
+        # Process-level cache keyed on device: constructing
+        # PianoTranscription reloads the CNN checkpoint (hundreds of MB),
+        # and the model doesn't depend on filter/frame settings — so apps
+        # built for different presets share one instance instead of each
+        # holding its own copy.
+        transcriptor = _transcriptors.get(self.device)
+        if transcriptor is None:
+            from piano_transcription_inference import PianoTranscription
+
+            transcriptor = PianoTranscription(device=self.device)
+            _transcriptors[self.device] = transcriptor
+        return transcriptor
+
     def run(self, audio_path: Path, outdir: Path, stem: Optional[str] = None) -> None:
         print("[APP] run() called")
         audio_path = audio_path.expanduser().resolve()
@@ -57,15 +119,43 @@ class TranscriptionApp:
         out_chords_txt = outdir / f"{stem}_chords.txt"
 
         print(f"[APP] Loading audio: {audio_path}")
-        audio, _ = librosa.load(str(audio_path), sr=sample_rate, mono=True)
-        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        audio = _load_audio_mono(audio_path)
         audio_dur = len(audio) / sample_rate
 
         print(f"[APP] Audio len={len(audio)} samples, dur={audio_dur:.3f}s")
 
-        transcriptor = PianoTranscription(device=self.device)
-        print("[APP] Transcribing ->", out_mid)
-        result = transcriptor.transcribe(audio, str(out_mid))
+        # Content-addressed cache: re-running the same audio with different
+        # filter presets is common during tuning, and the CNN inference is
+        # by far the slowest step. Key = hash of the raw samples; value =
+        # the transcription result plus the MIDI bytes it wrote.
+        cache_file = outdir / ".cache" / (
+            hashlib.blake2b(audio.tobytes(), digest_size=16).hexdigest() + ".pkl"
+        )
+        result = None
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    cached = pickle.load(f)
+                result = cached["result"]
+                out_mid.write_bytes(cached["midi"])
+                print(f"[APP] Transcription cache hit: {cache_file}")
+            except Exception:
+                result = None  # stale/corrupt cache: re-transcribe
+
+        if result is None:
+            transcriptor = self._get_transcriptor()
+            print("[APP] Transcribing ->", out_mid)
+            result = transcriptor.transcribe(audio, str(out_mid))
+            try:
+                cache_file.parent.mkdir(exist_ok=True)
+                with open(cache_file, "wb") as f:
+                    pickle.dump(
+                        {"result": result, "midi": out_mid.read_bytes()},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            except Exception:
+                pass  # caching is best-effort
 
         note_events_raw = result.get("est_note_events", [])
         pedal_events = result.get("est_pedal_events", [])
@@ -107,10 +197,14 @@ class TranscriptionApp:
         print(f"[APP] Wrote MIDI      : {out_mid}")
         print("[APP] run() finished ✅")
 
-    def run_audio(self, audio, *, outdir: Path, stem: str) -> None:
+    def run_audio(self, audio, *, outdir: Path, stem: str) -> Tuple[str, Optional[str]]:
         """
         Transcribe an in-memory mono audio array (float32) already at sample_rate.
         Writes: *_notes.txt, optionally *_chords.txt, and <stem>.mid
+
+        Returns (notes_txt, chords_txt) so callers can display the result
+        without reading the files back; chords_txt is None when chords are
+        disabled.
         """
         print("[APP] run_audio() called")
         outdir = outdir.expanduser().resolve()
@@ -124,15 +218,18 @@ class TranscriptionApp:
 
         if len(audio) < int(0.5 * sample_rate):
             print("[APP] run_audio(): buffer too short -> placeholder")
-            self.io.save_text(out_txt, "Filtered notes\n\n(Buffer warming up — play a bit longer)\n")
+            notes_txt = "Filtered notes\n\n(Buffer warming up — play a bit longer)\n"
+            chords_txt: Optional[str] = None
+            self.io.save_text(out_txt, notes_txt)
             if self.frame_cfg.write_chords:
-                self.io.save_text(out_chords, "Chord segments (frame-based)\n\n(Buffer warming up)\n")
-            return
+                chords_txt = "Chord segments (frame-based)\n\n(Buffer warming up)\n"
+                self.io.save_text(out_chords, chords_txt)
+            return notes_txt, chords_txt
 
         audio_dur = len(audio) / sample_rate
         print(f"[APP] run_audio(): samples={len(audio)}, dur={audio_dur:.3f}s -> transcribing")
 
-        transcriptor = PianoTranscription(device=self.device)
+        transcriptor = self._get_transcriptor()
         result = transcriptor.transcribe(audio, str(out_mid))
 
         note_events_raw = result.get("est_note_events", [])
@@ -147,6 +244,7 @@ class TranscriptionApp:
             notes_txt += "\n(No notes detected in this window)\n"
         self.io.save_text(out_txt, notes_txt)
 
+        chords_txt = None
         if self.frame_cfg.write_chords:
             frame_chords = self.frame_extractor.events_to_frame_chords(
                 note_events_filtered, audio_dur=audio_dur, cfg=self.frame_cfg
@@ -159,4 +257,5 @@ class TranscriptionApp:
                 chords_txt += "\n(No chords detected in this window)\n"
             self.io.save_text(out_chords, chords_txt)
 
-        print("[APP] run_audio() finished ✅")
\ No newline at end of file
+        print("[APP] run_audio() finished ✅")
+        return notes_txt, chords_txt
\ No newline at end of file
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from collections import defaultdict
 from typing import Dict, List, Optional
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class FilterConfig:
@@ -59,56 +62,73 @@ class NoteFilters:
         - Clamps offset_time to <= audio_dur
         - Ensures offset_time >= onset_time
         """
-        clamped = []
-        for ev in note_events:
-            onset = float(ev["onset_time"])
-            offset = float(ev["offset_time"])
+        if not note_events:
+            return []
 
-            if onset >= audio_dur:
-                continue
+        # Clamp/compare/sort vectorized in one shot; dict copies are built
+        # only for the events that survive, already in onset order.
+        n = len(note_events)
+        onsets = np.fromiter(
+            (float(ev["onset_time"]) for ev in note_events), dtype=np.float64, count=n
+        )
+        offsets = np.fromiter(
+            (float(ev["offset_time"]) for ev in note_events), dtype=np.float64, count=n
+        )
+        np.minimum(offsets, audio_dur, out=offsets)
+        np.maximum(offsets, onsets, out=offsets)
 
-            offset = min(offset, audio_dur)
-            offset = max(offset, onset)
+        keep = np.nonzero(onsets < audio_dur)[0]
+        keep = keep[np.argsort(onsets[keep], kind="stable")]
 
-            ev2 = dict(ev)
-            ev2["onset_time"] = onset
-            ev2["offset_time"] = offset
+        clamped = []
+        for i in keep:
+            ev2 = dict(note_events[i])
+            ev2["onset_time"] = float(onsets[i])
+            ev2["offset_time"] = float(offsets[i])
             clamped.append(ev2)
 
-        return NoteFilters.sort_by_onset(clamped)
+        return clamped
 
     @staticmethod
-    def cluster_by_onset(note_events: List[dict], cluster_window: float) -> List[List[dict]]:
+    def cluster_by_onset(
+        note_events: List[dict], cluster_window: float, assume_sorted: bool = False
+    ) -> List[List[dict]]:
         """
         Group notes into clusters by onset time (chord moments).
 
         Notes are in the same cluster if:
             onset - cluster_start_onset <= cluster_window
-        """
-        events = NoteFilters.sort_by_onset(note_events)
-        clusters: List[List[dict]] = []
-
-        current: List[dict] = []
-        cluster_start_onset: Optional[float] = None
-
-        for ev in events:
-            onset = float(ev["onset_time"])
-            if not current:
-                current = [ev]
-                cluster_start_onset = onset
-                continue
-
-            if onset - float(cluster_start_onset) <= cluster_window:
-                current.append(ev)
-            else:
-                clusters.append(current)
-                current = [ev]
-                cluster_start_onset = onset
-
-        if current:
-            clusters.append(current)
 
-        return clusters
+        assume_sorted=True skips the sort when the caller already has the
+        events in onset order (as apply_ABD does).
+        """
+        if not note_events:
+            return []
+
+        # One stable argsort over a flat onset array, then a break scan on
+        # the sorted floats. Breaks are measured against the cluster START
+        # (not the previous note), matching the original semantics.
+        n = len(note_events)
+        onsets = np.fromiter(
+            (float(ev["onset_time"]) for ev in note_events), dtype=np.float64, count=n
+        )
+        if assume_sorted:
+            order = np.arange(n)
+            sorted_onsets = onsets
+        else:
+            order = np.argsort(onsets, kind="stable")
+            sorted_onsets = onsets[order]
+
+        breaks: List[int] = []
+        start = sorted_onsets[0]
+        for i in range(1, n):
+            if sorted_onsets[i] - start > cluster_window:
+                breaks.append(i)
+                start = sorted_onsets[i]
+
+        return [
+            [note_events[j] for j in grp] for grp in np.split(order, breaks)
+        ]
 
     @staticmethod
     def dedupe_same_pitch_in_cluster(cluster: List[dict], dedupe_window: float) -> List[dict]:
@@ -122,21 +142,29 @@ class NoteFilters:
             sb = (NoteFilters.note_velocity(b), NoteFilters.note_duration(b))
             return a if sa >= sb else b
 
-        by_midi: Dict[int, List[dict]] = defaultdict(list)
-        for ev in NoteFilters.sort_by_onset(cluster):
-            by_midi[int(ev["midi_note"])].append(ev)
+        if not cluster:
+            return []
+
+        # One (midi, onset) sort puts each pitch's notes in a contiguous,
+        # onset-ordered run — no per-pitch buckets or bucket re-sorts needed.
+        events = sorted(
+            cluster, key=lambda ev: (int(ev["midi_note"]), float(ev["onset_time"]))
+        )
 
         kept: List[dict] = []
-        for _, evs in by_midi.items():
-            evs = NoteFilters.sort_by_onset(evs)
-            best = evs[0]
-            for ev in evs[1:]:
-                if abs(float(ev["onset_time"]) - float(best["onset_time"])) <= dedupe_window:
-                    best = better(best, ev)
-                else:
-                    kept.append(best)
-                    best = ev
-            kept.append(best)
+        best = events[0]
+        best_midi = int(best["midi_note"])
+        for ev in events[1:]:
+            midi = int(ev["midi_note"])
+            if midi == best_midi and (
+                abs(float(ev["onset_time"]) - float(best["onset_time"])) <= dedupe_window
+            ):
+                best = better(best, ev)
+            else:
+                kept.append(best)
+                best = ev
+                best_midi = midi
+        kept.append(best)
 
         return NoteFilters.sort_by_onset(kept)
 
@@ -178,20 +206,22 @@ class NoteFilters:
         Keep only the strongest K notes in a chord cluster.
         Strength = (velocity, duration).
         """
-        ranked = sorted(
+        top = heapq.nlargest(
+            max_notes,
             cluster,
             key=lambda ev: (NoteFilters.note_velocity(ev), NoteFilters.note_duration(ev)),
-            reverse=True,
         )
-        return NoteFilters.sort_by_onset(ranked[:max_notes])
+        return NoteFilters.sort_by_onset(top)
 
     @staticmethod
-    def dedupe_same_midi_globally(note_events: List[dict], dedupe_window: float) -> List[dict]:
+    def dedupe_same_midi_globally(
+        note_events: List[dict], dedupe_window: float, assume_sorted: bool = False
+    ) -> List[dict]:
         """
         Remove near-duplicate repeats of the same MIDI note across the whole audio.
         If the same MIDI appears again within dedupe_window seconds, keep only the stronger one.
         """
-        events = NoteFilters.sort_by_onset(note_events)
+        events = note_events if assume_sorted else NoteFilters.sort_by_onset(note_events)
 
         def better(a: dict, b: dict) -> dict:
             return a if (NoteFilters.note_velocity(a), NoteFilters.note_duration(a)) >= (
@@ -236,31 +266,32 @@ class NoteFilters:
         if not cluster:
             return cluster
 
-        best_by_midi: Dict[int, dict] = {}
+        # MIDI is bounded to 0..127, so fixed-size arrays replace the
+        # best_by_midi dict: direct indexing for the strongest note per
+        # pitch, and shifted-array comparisons for the interval checks.
+        best_vel = np.full(128, -1, dtype=np.int64)
+        best_dur = np.full(128, -1.0, dtype=np.float64)
         for ev in cluster:
             midi = int(ev["midi_note"])
-            if midi not in best_by_midi:
-                best_by_midi[midi] = ev
-            else:
-                a = best_by_midi[midi]
-                b = ev
-                best_by_midi[midi] = a if (NoteFilters.note_velocity(a), NoteFilters.note_duration(a)) >= (
-                    NoteFilters.note_velocity(b), NoteFilters.note_duration(b)
-                ) else b
-
-        to_drop = set()
-        for midi_high, ev_high in best_by_midi.items():
-            v_high = NoteFilters.note_velocity(ev_high)
-            for interval in harmonic_intervals:
-                midi_base = midi_high - int(interval)
-                if midi_base in best_by_midi:
-                    ev_base = best_by_midi[midi_base]
-                    v_base = NoteFilters.note_velocity(ev_base)
-                    if v_base >= v_high * min_base_velocity_ratio:
-                        to_drop.add(midi_high)
-                        break
-
-        kept = [ev for ev in cluster if int(ev["midi_note"]) not in to_drop]
+            v = NoteFilters.note_velocity(ev)
+            d = NoteFilters.note_duration(ev)
+            if (v, d) > (best_vel[midi], best_dur[midi]):
+                best_vel[midi] = v
+                best_dur[midi] = d
+
+        present = best_vel >= 0
+        to_drop = np.zeros(128, dtype=bool)
+        for interval in harmonic_intervals:
+            interval = int(interval)
+            base_vel = np.full(128, -1, dtype=np.int64)
+            base_vel[interval:] = best_vel[: 128 - interval]
+            to_drop |= (
+                present
+                & (base_vel >= 0)
+                & (base_vel >= best_vel * min_base_velocity_ratio)
+            )
+
+        kept = [ev for ev in cluster if not to_drop[int(ev["midi_note"])]]
         return NoteFilters.sort_by_onset(kept)
 
     @staticmethod
@@ -277,32 +308,34 @@ class NoteFilters:
         if not note_events:
             return note_events
 
-        occ = defaultdict(int)
-        tot_dur = defaultdict(float)
+        # Per-pitch occurrence counts and total durations via bincount,
+        # then one gather back through the midi array to decide keeps.
+        n = len(note_events)
+        midis = np.fromiter(
+            (int(ev["midi_note"]) for ev in note_events), dtype=np.int64, count=n
+        )
+        durs = np.fromiter(
+            (NoteFilters.note_duration(ev) for ev in note_events),
+            dtype=np.float64,
+            count=n,
+        )
 
-        for ev in note_events:
-            midi = int(ev["midi_note"])
-            occ[midi] += 1
-            tot_dur[midi] += NoteFilters.note_duration(ev)
+        occ = np.bincount(midis, minlength=128)
+        tot_dur = np.bincount(midis, weights=durs, minlength=128)
 
-        max_total = max(tot_dur.values()) if tot_dur else 0.0
+        max_total = float(tot_dur.max())
         dur_threshold = (min_total_dur_ratio_of_max * max_total) if max_total > 0 else 0.0
 
-        filtered = []
-        for ev in note_events:
-            midi = int(ev["midi_note"])
-            v = NoteFilters.note_velocity(ev)
-
-            if keep_if_velocity_ge is not None and v >= int(keep_if_velocity_ge):
-                filtered.append(ev)
-                continue
-            if occ[midi] >= int(min_occurrences):
-                filtered.append(ev)
-                continue
-            if tot_dur[midi] >= float(dur_threshold):
-                filtered.append(ev)
-                continue
+        keep = (occ[midis] >= int(min_occurrences)) | (tot_dur[midis] >= dur_threshold)
+        if keep_if_velocity_ge is not None:
+            vels = np.fromiter(
+                (NoteFilters.note_velocity(ev) for ev in note_events),
+                dtype=np.int64,
+                count=n,
+            )
+            keep |= vels >= int(keep_if_velocity_ge)
 
+        filtered = [note_events[i] for i in np.nonzero(keep)[0]]
         return NoteFilters.sort_by_onset(filtered)
 
     @classmethod
@@ -313,25 +346,36 @@ class NoteFilters:
         2) D: harmonic removal inside clusters
         3) A: global consistency cleanup
         """
+        # Invariant through the pipeline: `events` stays onset-sorted.
+        # Clusters partition the sorted order contiguously and every
+        # sub-filter returns its cluster onset-sorted, so concatenating
+        # pruned clusters is already globally sorted — the per-stage
+        # re-sorts are skipped.
         events = cls.sort_by_onset(note_events)
 
         if cfg.enable_B:
-            clusters = cls.cluster_by_onset(events, cluster_window=cfg.cluster_window)
+            clusters = cls.cluster_by_onset(
+                events, cluster_window=cfg.cluster_window, assume_sorted=True
+            )
             pruned: List[dict] = []
             for c in clusters:
                 c = cls.dedupe_same_pitch_in_cluster(c, dedupe_window=cfg.dedupe_window)
                 c = cls.dedupe_pitch_class_in_cluster(c)
                 c = cls.keep_top_k_in_cluster(c, max_notes=cfg.max_notes_per_cluster)
                 pruned.extend(c)
-            events = cls.dedupe_same_midi_globally(pruned, dedupe_window=cfg.dedupe_window)
+            events = cls.dedupe_same_midi_globally(
+                pruned, dedupe_window=cfg.dedupe_window, assume_sorted=True
+            )
 
         if cfg.enable_D:
-            clusters = cls.cluster_by_onset(events, cluster_window=cfg.cluster_window)
+            clusters = cls.cluster_by_onset(
+                events, cluster_window=cfg.cluster_window, assume_sorted=True
+            )
             pruned: List[dict] = []
             for c in clusters:
                 c = cls.drop_likely_harmonics(c, min_base_velocity_ratio=cfg.harmonic_velocity_ratio)
                 pruned.extend(c)
-            events = cls.sort_by_onset(pruned)
+            events = pruned
 
         if cfg.enable_A:
             events = cls.adaptive_consistency_filter(
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple, Set
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
 
 from .filters import NoteFilters
 from .utils import midi_to_name
 
 
+@lru_cache(maxsize=4096)
+def _fmt_chord(midis: Tuple[int, ...]) -> bytes:
+    """Format a chord's midi tuple as e.g. b"C4-E4-G4" (memoized: merged
+    segments repeat the same chords constantly)."""
+    return "-".join(midi_to_name(m) for m in midis).encode("ascii")
+
+
 @dataclass(frozen=True)
 class FrameConfig:
     """
@@ -26,6 +36,9 @@ class FrameChord:
     t0: float
     t1: float
     midis: Tuple[int, ...]
+    # Same midi set packed as a 128-bit mask (bit m set <=> midi m active);
+    # lets merge_frames do set algebra with integer ops.
+    mask: int = 0
 
 
 @dataclass
@@ -47,11 +60,21 @@ class FrameChordExtractor:
     _MIN_SEGMENT_DUR = 0.10
 
     @staticmethod
-    def _jaccard(a: Set[int], b: Set[int]) -> float:
-        if not a and not b:
-            return 1.0
+    def _jaccard(a: int, b: int) -> float:
+        """Jaccard similarity of two midi bitmasks (popcount of AND / OR)."""
         u = a | b
-        return 0.0 if not u else (len(a & b) / len(u))
+        if not u:
+            return 1.0
+        return (a & b).bit_count() / u.bit_count()
+
+    @staticmethod
+    def _mask_to_midis(mask: int) -> Tuple[int, ...]:
+        midis = []
+        while mask:
+            low = mask & -mask
+            midis.append(low.bit_length() - 1)
+            mask ^= low
+        return tuple(midis)
 
     def events_to_frame_chords(
         self,
@@ -67,32 +90,68 @@ class FrameChordExtractor:
         """
         if cfg.frame_hop <= 0:
             raise ValueError("frame_hop must be > 0")
+        if audio_dur <= 0 or not note_events:
+            return []
 
-        # Normalize note events to (onset, offset, midi)
-        norm = []
-        for ev in note_events:
-            onset = float(ev["onset_time"])
-            offset = float(ev["offset_time"])
-            midi = int(ev["midi_note"])
-            if offset > onset:
-                norm.append((onset, offset, midi))
+        hop = cfg.frame_hop
+        n_frames = int(np.ceil(audio_dur / hop))
+
+        # Normalize note events into parallel arrays (skip zero-length notes).
+        n = len(note_events)
+        onsets = np.fromiter(
+            (float(ev["onset_time"]) for ev in note_events), dtype=np.float64, count=n
+        )
+        offsets = np.fromiter(
+            (float(ev["offset_time"]) for ev in note_events), dtype=np.float64, count=n
+        )
+        midis = np.fromiter(
+            (int(ev["midi_note"]) for ev in note_events), dtype=np.int64, count=n
+        )
+        valid = offsets > onsets
+
+        # A note is active in frame f (spanning [f*hop, (f+1)*hop)) iff
+        # onset < (f+1)*hop and offset > f*hop, i.e. for f in [f0, f1):
+        f0 = np.maximum(np.floor(onsets / hop).astype(np.int64), 0)
+        f1 = np.minimum(np.ceil(offsets / hop).astype(np.int64), n_frames)
+        counts = np.where(valid, np.maximum(f1 - f0, 0), 0)
+
+        total = int(counts.sum())
+        if total == 0:
+            return []
 
-        frames: List[FrameChord] = []
-        t = 0.0
-        while t < audio_dur:
-            t0 = t
-            t1 = min(t + cfg.frame_hop, audio_dur)
+        # Expand each note into its (frame, midi) pairs in one shot: the
+        # classic repeat + ramp pattern instead of the old O(F*N) rescan.
+        ramp = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        frame_ids = np.repeat(f0, counts) + ramp
+        midi_rep = np.repeat(midis, counts)
 
-            active: Set[int] = set()
-            for onset, offset, midi in norm:
-                if onset < t1 and offset > t0:
-                    active.add(midi)
+        # Bucket by frame: stable sort, then split at frame boundaries.
+        order = np.argsort(frame_ids, kind="stable")
+        frame_sorted = frame_ids[order]
+        midi_sorted = midi_rep[order]
+        breaks = np.nonzero(np.diff(frame_sorted))[0] + 1
 
+        frames: List[FrameChord] = []
+        for start, group in zip(
+            np.concatenate(([0], breaks)), np.split(midi_sorted, breaks)
+        ):
+            uniq = np.unique(group)
             # Only keep frames that look like actual chords (>= 2 notes)
-            if len(active) >= self._MIN_ACTIVE_NOTES:
-                frames.append(FrameChord(t0=t0, t1=t1, midis=tuple(sorted(active))))
-
-            t += cfg.frame_hop
+            if len(uniq) < self._MIN_ACTIVE_NOTES:
+                continue
+            f = int(frame_sorted[start])
+            mids = tuple(int(m) for m in uniq)
+            mask = 0
+            for m in mids:
+                mask |= 1 << m
+            frames.append(
+                FrameChord(
+                    t0=f * hop,
+                    t1=min((f + 1) * hop, audio_dur),
+                    midis=mids,
+                    mask=mask,
+                )
+            )
 
         return frames
 
@@ -112,34 +171,31 @@ class FrameChordExtractor:
 
         cur_t0 = frames[0].t0
         cur_t1 = frames[0].t1
-        cur_set: Set[int] = set(frames[0].midis)
+        cur_mask = frames[0].mask
 
         for fr in frames[1:]:
-            fr_set = set(fr.midis)
-            sim = self._jaccard(cur_set, fr_set)
+            sim = self._jaccard(cur_mask, fr.mask)
 
             if sim >= self._MIN_JACCARD:
                 cur_t1 = fr.t1
-                cur_set = (cur_set & fr_set) if (cur_set and fr_set) else fr_set
+                cur_mask = (cur_mask & fr.mask) if (cur_mask and fr.mask) else fr.mask
             else:
-                if (cur_t1 - cur_t0) >= self._MIN_SEGMENT_DUR and cur_set:
-                    segs.append(ChordSegment(t0=cur_t0, t1=cur_t1, midis=tuple(sorted(cur_set))))
+                if (cur_t1 - cur_t0) >= self._MIN_SEGMENT_DUR and cur_mask:
+                    segs.append(ChordSegment(t0=cur_t0, t1=cur_t1, midis=self._mask_to_midis(cur_mask)))
                 cur_t0 = fr.t0
                 cur_t1 = fr.t1
-                cur_set = fr_set
+                cur_mask = fr.mask
 
-        if (cur_t1 - cur_t0) >= self._MIN_SEGMENT_DUR and cur_set:
-            segs.append(ChordSegment(t0=cur_t0, t1=cur_t1, midis=tuple(sorted(cur_set))))
+        if (cur_t1 - cur_t0) >= self._MIN_SEGMENT_DUR and cur_mask:
+            segs.append(ChordSegment(t0=cur_t0, t1=cur_t1, midis=self._mask_to_midis(cur_mask)))
 
         return segs
 
     @staticmethod
     def build_chords_txt(segments: List[ChordSegment], title: str = "Chord segments (frame-based)") -> str:
-        def fmt(midis: Tuple[int, ...]) -> str:
-            return "-".join(midi_to_name(m) for m in midis)
-
-        lines = [title, "", "idx\tstart(s)\tend(s)\tdur(s)\tnotes"]
+        buf = bytearray(title.encode("utf-8"))
+        buf += b"\n\nidx\tstart(s)\tend(s)\tdur(s)\tnotes"
         for i, s in enumerate(segments):
-            dur = s.t1 - s.t0
-            lines.append(f"{i}\t{s.t0:.3f}\t{s.t1:.3f}\t{dur:.3f}\t{fmt(s.midis)}")
-        return "\n".join(lines) + "\n"
\ No newline at end of file
+            buf += b"\n%d\t%.3f\t%.3f\t%.3f\t%s" % (i, s.t0, s.t1, s.t1 - s.t0, _fmt_chord(s.midis))
+        buf += b"\n"
+        return buf.decode("utf-8")
\ No newline at end of file
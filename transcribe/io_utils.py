@@ -4,6 +4,11 @@ import json
 from pathlib import Path
 from typing import Any, List
 
+try:
+    import orjson  # Rust serializer, several times faster than stdlib json
+except Exception:
+    orjson = None
+
 from .filters import NoteFilters
 from .utils import midi_to_name, make_json_safe
 
@@ -12,7 +17,10 @@ class IOWriter:
     @staticmethod
     def build_notes_txt(note_events: List[dict], title: str) -> str:
         note_events = NoteFilters.sort_by_onset(note_events)
-        lines = [title, "", "idx\tmidi\tname\tonset(s)\toffset(s)\tdur(s)\tvelocity"]
+        # Stream rows into a bytearray with C-level bytes-% formatting;
+        # avoids the per-row f-string plus line-list plus join for big runs.
+        buf = bytearray(title.encode("utf-8"))
+        buf += b"\n\nidx\tmidi\tname\tonset(s)\toffset(s)\tdur(s)\tvelocity"
         for i, n in enumerate(note_events):
             onset = float(n["onset_time"])
             offset = float(n["offset_time"])
@@ -20,8 +28,11 @@ class IOWriter:
             midi = int(n["midi_note"])
             vel = n.get("velocity", "")
             name = midi_to_name(midi)
-            lines.append(f"{i}\t{midi}\t{name}\t{onset:.3f}\t{offset:.3f}\t{dur:.3f}\t{vel}")
-        return "\n".join(lines) + "\n"
+            buf += b"\n%d\t%d\t%s\t%.3f\t%.3f\t%.3f\t%s" % (
+                i, midi, name.encode("ascii"), onset, offset, dur, str(vel).encode("ascii"),
+            )
+        buf += b"\n"
+        return buf.decode("utf-8")
 
     @staticmethod
     def save_text(path: Path, text: str) -> None:
@@ -30,6 +41,17 @@ class IOWriter:
 
     @staticmethod
     def save_json(path: Path, payload: Any) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False, default=make_json_safe)
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY handles numpy scalars/arrays natively,
+            # so make_json_safe only runs for the leftovers.
+            path.write_bytes(
+                orjson.dumps(
+                    payload,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    default=make_json_safe,
+                )
+            )
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False, default=make_json_safe)
         print(f"[IO] saved json: {path}")
\ No newline at end of file
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import re
 import tempfile
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
@@ -30,12 +29,14 @@ def _parse_notes_txt(notes_txt: str) -> List[NoteEvent]:
         line = line.strip()
         if not line:
             continue
-        if line.lower().startswith("idx"):
+        # Lowercase only the prefix we compare against, not the whole line.
+        if line[:3].lower() == "idx":
             continue
-        if line.lower().startswith("filtered notes"):
+        if line[:14].lower() == "filtered notes":
             continue
 
-        parts = re.split(r"\s+", line)
+        # str.split() collapses whitespace runs in C; no regex VM per line.
+        parts = line.split()
         # We expect at least: idx midi name onset ...
         if len(parts) < 4:
             continue
@@ -84,22 +85,20 @@ def _build_part(groups: List[List[NoteEvent]], clef: m21.clef.Clef) -> m21.strea
     p.insert(0, clef)
     p.insert(0, m21.meter.TimeSignature("4/4"))
 
-    offset = 0.0
+    # Steps are uniform quarter notes, so ordered append() lands each
+    # element at the same offsets insert() did — without insert()'s
+    # per-element offset-map rebuild (quadratic over long scores).
     for g in groups:
         midis = sorted({e.midi for e in g})
         if not midis:
             continue
 
         if len(midis) == 1:
-            n = m21.note.Note(midis[0])
-            n.quarterLength = 1
-            p.insert(offset, n)
+            el: m21.note.NotRest = m21.note.Note(midis[0])
         else:
-            ch = m21.chord.Chord(midis)
-            ch.quarterLength = 1
-            p.insert(offset, ch)
-
-        offset += 1.0
+            el = m21.chord.Chord(midis)
+        el.quarterLength = 1
+        p.append(el)
 
     return p
 
@@ -1,46 +1,61 @@
 from __future__ import annotations
 
-NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+import sys
+
+import numpy as np
+
+NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# All 128 MIDI names precomputed once; the whole table fits in cache and
+# turns midi_to_name into a plain tuple index in the output builders.
+_MIDI_NAMES = tuple(f"{NOTE_NAMES[m % 12]}{(m // 12) - 1}" for m in range(128))
 
 
 def midi_to_name(midi: int) -> str:
+    if 0 <= midi < 128:
+        return _MIDI_NAMES[midi]
     octave = (midi // 12) - 1
     return f"{NOTE_NAMES[midi % 12]}{octave}"
 
 
 def make_json_safe(obj, seen=None):
-    if seen is None:
-        seen = set()
-
-    obj_id = id(obj)
-    if obj_id in seen:
-        return "<circular_ref>"
-    seen.add(obj_id)
-
-    try:
-        import numpy as np
-        if isinstance(obj, (np.float32, np.float64)):
-            return float(obj)
-        if isinstance(obj, (np.int32, np.int64)):
-            return int(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-    except Exception:
-        pass
-
-    try:
-        import torch
-        if isinstance(obj, torch.Tensor):
-            return obj.detach().cpu().tolist()
-    except Exception:
-        pass
+    """
+    Recursively convert obj into plain JSON-serializable types.
+
+    `seen` tracks the ids of the containers on the CURRENT path only
+    (added on entry, removed on exit), so true cycles become
+    "<circular_ref>" while the same sub-structure shared by two siblings
+    is serialized normally in both places.
+    """
+    if isinstance(obj, (np.float32, np.float64)):
+        return float(obj)
+    if isinstance(obj, (np.int32, np.int64)):
+        return int(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+
+    # A Tensor can only exist if torch is already imported, so probing
+    # sys.modules replaces the per-call import attempt without ever
+    # pulling torch in ourselves (it stays lazy for cold start).
+    torch = sys.modules.get("torch")
+    if torch is not None and isinstance(obj, torch.Tensor):
+        return obj.detach().cpu().tolist()
 
     if obj is None or isinstance(obj, (bool, int, float, str)):
         return obj
 
-    if isinstance(obj, dict):
-        return {str(k): make_json_safe(v, seen) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [make_json_safe(v, seen) for v in obj]
+    if isinstance(obj, (dict, list, tuple)):
+        if seen is None:
+            seen = set()
+        obj_id = id(obj)
+        if obj_id in seen:
+            return "<circular_ref>"
+        seen.add(obj_id)
+        if isinstance(obj, dict):
+            out = {str(k): make_json_safe(v, seen) for k, v in obj.items()}
+        else:
+            out = [make_json_safe(v, seen) for v in obj]
+        seen.discard(obj_id)
+        return out
 
     return str(obj)
\ No newline at end of file
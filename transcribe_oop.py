@@ -15,14 +15,16 @@ Filters are controlled via one switch: --preset {raw, clean, aggressive}
 from __future__ import annotations
 
 import argparse
+import functools
 from pathlib import Path
 
-from transcribe.app import TranscriptionApp
-from transcribe.filters import FilterConfig
-from transcribe.frame import FrameConfig
+# transcribe.* is imported inside main()/_filter_cfg_from_preset: it pulls
+# in torch and the transcription model code, and --help / bad-args runs
+# should not pay seconds of import time before argparse even looks at argv.
 
 
-def _filter_cfg_from_preset(preset: str) -> FilterConfig:
+@functools.lru_cache(maxsize=4)
+def _filter_cfg_from_preset(preset: str) -> "FilterConfig":
     """
     Map a simple preset name -> filter parameters.
 
@@ -35,6 +37,8 @@ def _filter_cfg_from_preset(preset: str) -> FilterConfig:
     aggressive:
       - A + B + D (strong cleanup): also removes one-off ghost pitches globally
     """
+    from transcribe.filters import FilterConfig
+
     preset = preset.lower().strip()
 
     if preset == "raw":
@@ -67,7 +71,8 @@ def _filter_cfg_from_preset(preset: str) -> FilterConfig:
     raise ValueError(f"Unknown preset: {preset}. Use raw|clean|aggressive.")
 
 
-def parse_args():
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Piano transcription -> TXT (+ optional frame-based chords).")
 
     p.add_argument("--audio", required=True, help="Input audio file (wav/mp3/ogg/...).")
@@ -91,27 +96,42 @@ def parse_args():
     p.add_argument("--print-raw", action="store_true", help="Also print raw notes to console.")
     p.add_argument("--print-audio-info", action="store_true", help="Print audio duration and sample count.")
 
-    return p.parse_args()
+    return p
+
+
+def parse_args():
+    # The parser is built once per process; parse_args() itself does not
+    # mutate parser state, so re-parsing with fresh argv is safe.
+    return _get_parser().parse_args()
 
 
 def main():
     args = parse_args()
 
-    audio_path = Path(args.audio).expanduser().resolve()
-    outdir = Path(args.outdir).expanduser().resolve() if args.outdir else audio_path.parent
+    # No resolve() here: app.run canonicalizes when it actually needs to,
+    # and a lexical path is enough for the fast existence check below.
+    audio_path = Path(args.audio).expanduser()
+    if not audio_path.exists():
+        raise SystemExit(f"Audio file not found: {audio_path}")
+    outdir = Path(args.outdir).expanduser() if args.outdir else audio_path.parent
+
+    from transcribe.app import TranscriptionApp
+    from transcribe.frame import FrameConfig
 
     filter_cfg = _filter_cfg_from_preset(args.preset)
 
+    # argparse already delivered the right types (store_true -> bool,
+    # type=float -> float), so no re-casting here.
     frame_cfg = FrameConfig(
-        write_chords=bool(args.chords),
-        frame_hop=float(args.hop),
+        write_chords=args.chords,
+        frame_hop=args.hop,
     )
 
     app = TranscriptionApp(
         filter_cfg=filter_cfg,
         frame_cfg=frame_cfg,
-        print_raw=bool(args.print_raw),
-        print_audio_info=bool(args.print_audio_info),
+        print_raw=args.print_raw,
+        print_audio_info=args.print_audio_info,
     )
 
     app.run(audio_path=audio_path, outdir=outdir)